@@ -16,6 +16,7 @@ from backend.memory.memory_stream import MemoryStream
 from backend.memory.conversation_context import ConversationContext
 from backend.channels.smartphone import Smartphone
 from backend.llms.prompt_builder import build_system_prompt
+from backend.research.event_logger import SimEvent, EventType
 
 logger = logging.getLogger("root.agents")
 
@@ -66,7 +67,8 @@ class BaseArcaneAgent(mesa.Agent):
         )
 
         # Communication
-        self.smartphone = Smartphone(owner_id=agent_id, owner_name=self.name)
+        self.smartphone = Smartphone(owner_id=agent_id, owner_name=self.name,
+                                     rng=model.random)
 
         # Per-interlocutor conversation context (survives across steps)
         self.conversation_ctx = ConversationContext(
@@ -133,17 +135,13 @@ class BaseArcaneAgent(mesa.Agent):
         reflection_interval = self.model.config.get("memory", {}).get(
             "reflection_interval_steps", 10
         )
+        # (deferred to the end of the model step so reflections can overlap)
         if (self._steps_since_reflection >= reflection_interval
                 or self.memory.should_reflect()):
-            self.reflect()
+            self.model.schedule_reflection(self)
             self._steps_since_reflection = 0
 
         # Log step activity
-        self.model.event_logger.log(
-            self.model.event_logger.__class__.__mro__[0]  # type hint workaround
-        ) if False else None
-
-        from backend.research.event_logger import SimEvent, EventType
         self.model.event_logger.log(SimEvent(
             step=step_num,
             event_type=EventType.AGENT_PLAN,
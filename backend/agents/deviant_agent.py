@@ -186,11 +186,11 @@ class DeviantAgent(BaseArcaneAgent):
             "backstory": "A friendly professional interested in connecting.",
         })
 
-        # True objective
-        self.objective = persona_data.get("objective", {
+        # True objective (copied — persona dicts are shared via the loader cache)
+        self.objective = dict(persona_data.get("objective", {
             "target_info": "personal information",
             "target_agents": [],  # IDs of target agents
-        })
+        }))
 
         # Goal tree state
         self.current_phase = 1
@@ -9,39 +9,38 @@ Usage:
 """
 
 import os
-import yaml
 import logging
+from functools import lru_cache
 from pathlib import Path
 
+from backend.config.yaml_loader import load_yaml
+
 logger = logging.getLogger("root.personas")
 
 _PERSONAS_DIR = Path(__file__).parent
-_cache: dict[str, dict] = {}
 
 
+@lru_cache(maxsize=None)
 def load_persona(persona_id: str) -> dict:
     """Load a persona by ID from the personas/ directory.
 
     Searches benign/ and deviant/ subdirectories. Results are cached
     in memory after first load for zero-overhead repeated access.
+    Persona files are treated as immutable for the lifetime of the process.
 
     Returns:
-        dict with all persona fields (id, name, type, traits, secrets, etc.)
+        dict with all persona fields (id, name, type, traits, secrets, etc.).
+        The dict is shared by every caller — copy it before mutating.
 
     Raises:
         FileNotFoundError if no matching YAML file exists.
     """
-    if persona_id in _cache:
-        return _cache[persona_id]
-
     # Search in both subdirectories
     for subdir in ("benign", "deviant"):
         path = _PERSONAS_DIR / subdir / f"{persona_id}.yaml"
         if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = load_yaml(path)
             data.setdefault("id", persona_id)
-            _cache[persona_id] = data
             logger.debug(f"Loaded persona '{persona_id}' from {path}")
             return data
 
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from backend.agents.base_agent import BaseArcaneAgent
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message sent through any channel."""
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
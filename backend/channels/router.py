@@ -42,6 +42,13 @@ class ChannelRouter:
             "social_dm": self.social_dm,
         }
 
+        # Bound methods for the hot send path (proximity + SMS carry most traffic)
+        self._fast_send = {
+            "proximity": self.proximity.send,
+            "sms": self.sms.send,
+        }
+        self._log_message = event_logger.log_message
+
     def send(self, sender: "BaseArcaneAgent", recipient: "BaseArcaneAgent",
              channel_name: str, content: str, step: int, sim_time: str,
              **kwargs) -> Message:
@@ -49,14 +56,17 @@ class ChannelRouter:
         Send a message through the specified channel.
         Logs the event and returns the Message object.
         """
-        channel = self._channels.get(channel_name)
-        if channel is None:
-            raise ValueError(f"Unknown channel: {channel_name}")
+        channel_send = self._fast_send.get(channel_name)
+        if channel_send is None:
+            channel = self._channels.get(channel_name)
+            if channel is None:
+                raise ValueError(f"Unknown channel: {channel_name}")
+            channel_send = channel.send
 
-        msg = channel.send(sender, recipient, content, step=step, **kwargs)
+        msg = channel_send(sender, recipient, content, step=step, **kwargs)
 
         # Log the send event
-        self.event_logger.log_message(
+        self._log_message(
             step=step, sim_time=sim_time,
             sender_id=msg.sender_id, recipient_id=msg.recipient_id,
             channel=channel_name, content=content,
@@ -73,39 +83,48 @@ class ChannelRouter:
                         agents_by_id: dict[str, "BaseArcaneAgent"]) -> list[Message]:
         """
         Deliver pending async messages (SMS, email, DM) that are due.
-        Called at the start of each model step.
+        Returns the delivered messages.
+        """
+        return list(self._deliver_due(current_step, sim_time, agents_by_id))
+
+    def deliver_pending_count(self, current_step: int, sim_time: str,
+                              agents_by_id: dict[str, "BaseArcaneAgent"]) -> int:
+        """
+        Deliver pending async messages (SMS, email, DM) that are due.
+        Called at the start of each model step. Returns how many were delivered.
         """
-        all_delivered = []
+        count = 0
+        for _ in self._deliver_due(current_step, sim_time, agents_by_id):
+            count += 1
+        return count
+
+    def _deliver_due(self, current_step: int, sim_time: str,
+                     agents_by_id: dict[str, "BaseArcaneAgent"]):
+        """Deliver, push to smartphones and log each due message, yielding it."""
+        from backend.research.event_logger import SimEvent, EventType
 
         for channel_name in ("sms", "email", "social_dm"):
             channel = self._channels[channel_name]
-            if hasattr(channel, "deliver_pending"):
-                delivered = channel.deliver_pending(current_step)
-                for msg in delivered:
-                    # Push to recipient's smartphone
-                    recipient = agents_by_id.get(msg.recipient_id)
-                    if recipient and hasattr(recipient, 'smartphone'):
-                        recipient.smartphone.receive_message(msg)
-
-                    # Log delivery
-                    self.event_logger.log(
-                        self.event_logger.__class__.__mro__[0]  # avoid circular
-                    ) if False else None  # placeholder
-
-                    from backend.research.event_logger import SimEvent, EventType
-                    self.event_logger.log(SimEvent(
-                        step=current_step,
-                        event_type=EventType.MESSAGE_RECEIVED,
-                        timestamp=sim_time,
-                        agent_id=msg.recipient_id,
-                        target_id=msg.sender_id,
-                        channel=channel_name,
-                        content=f"Delivered {channel_name} message to {msg.recipient_id}",
-                    ))
-
-                all_delivered.extend(delivered)
-
-        return all_delivered
+            if not hasattr(channel, "deliver_pending"):
+                continue
+            for msg in channel.deliver_pending(current_step):
+                # Push to recipient's smartphone
+                recipient = agents_by_id.get(msg.recipient_id)
+                if recipient and hasattr(recipient, 'smartphone'):
+                    recipient.smartphone.receive_message(msg)
+
+                # Log delivery
+                self.event_logger.log(SimEvent(
+                    step=current_step,
+                    event_type=EventType.MESSAGE_RECEIVED,
+                    timestamp=sim_time,
+                    agent_id=msg.recipient_id,
+                    target_id=msg.sender_id,
+                    channel=channel_name,
+                    content=f"Delivered {channel_name} message to {msg.recipient_id}",
+                ))
+
+                yield msg
 
     def get_channel(self, channel_name: str):
         """Get a channel instance by name."""
@@ -9,6 +9,8 @@ communication identity.
 
 import random
 import string
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
@@ -16,28 +18,39 @@ if TYPE_CHECKING:
     from backend.channels.base_channel import Message
 
 
-def _generate_phone_number() -> str:
+# Maximum messages retained per inbox channel (and per thread); oldest are evicted
+ARCANE_INBOX_MAXLEN = 500
+
+# Channel display names for the inbox summary (part of the agents' prompt
+# text, so keep them stable)
+_CH_DISPLAY = {"sms": "SMS", "email": "Email", "social_dm": "Social Dm"}
+
+
+def _generate_phone_number(rng=random) -> str:
     """Generate a fake phone number."""
-    return f"+1-555-{random.randint(100,999)}-{random.randint(1000,9999)}"
+    return f"+1-555-{rng.randint(100,999)}-{rng.randint(1000,9999)}"
 
 
-def _generate_email(name: str) -> str:
+def _generate_email(name: str, rng=random) -> str:
     """Generate a fake email from agent name."""
     clean = name.lower().replace(" ", ".")
-    domain = random.choice(["gmail.com", "outlook.com", "yahoo.com"])
+    domain = rng.choice(["gmail.com", "outlook.com", "yahoo.com"])
     return f"{clean}@{domain}"
 
 
-def _generate_handle(name: str) -> str:
+def _generate_handle(name: str, rng=random) -> str:
     """Generate a social media handle."""
     clean = name.lower().replace(" ", "_")
-    suffix = random.randint(10, 99)
+    suffix = rng.randint(10, 99)
     return f"@{clean}{suffix}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactInfo:
-    """Contact information for another agent."""
+    """Contact information for another agent.
+
+    Instances may be shared between contact books — treat as read-only.
+    """
     agent_id: str
     name: str
     phone_number: Optional[str] = None
@@ -54,46 +67,60 @@ class Smartphone:
     for all remote (non-proximity) communication.
     """
 
-    def __init__(self, owner_id: str, owner_name: str):
+    # Remote channels the phone keeps inboxes for
+    _CHANNELS: tuple[str, ...] = ("sms", "email", "social_dm")
+
+    def __init__(self, owner_id: str, owner_name: str,
+                 rng: random.Random | None = None):
+        """
+        Args:
+            owner_id: Agent ID of the phone's owner
+            owner_name: Display name used to derive email and handles
+            rng: Random source for identity generation (e.g. the model's
+                 seeded RNG); defaults to the global random module
+        """
         self.owner_id = owner_id
         self.owner_name = owner_name
 
         # Communication identity
-        self.phone_number = _generate_phone_number()
-        self.email_address = _generate_email(owner_name)
+        rng = rng or random
+        self.phone_number = _generate_phone_number(rng)
+        self.email_address = _generate_email(owner_name, rng)
         self.social_handles: dict[str, str] = {
-            "LinkedInSim": _generate_handle(owner_name),
+            "LinkedInSim": _generate_handle(owner_name, rng),
         }
 
         # Contact book
         self.contacts: dict[str, ContactInfo] = {}
 
-        # Per-channel inbox (channel_name -> list of messages)
-        self.inbox: dict[str, list["Message"]] = {
-            "sms": [],
-            "email": [],
-            "social_dm": [],
+        # Per-channel inbox (channel_name -> bounded deque of messages)
+        self.inbox: dict[str, deque["Message"]] = {
+            ch: deque(maxlen=ARCANE_INBOX_MAXLEN) for ch in self._CHANNELS
         }
 
-        # Notification queue — unread message counts
-        self._unread_counts: dict[str, int] = {
-            "sms": 0,
-            "email": 0,
-            "social_dm": 0,
+        # Thread index ((other_agent_id, channel_name) -> messages), in arrival order
+        self._threads: dict[tuple[str, str], deque["Message"]] = {}
+
+        # Unread index (channel_name -> {message_id: message}), in arrival order
+        self._unread_by_channel: dict[str, dict[str, "Message"]] = {
+            ch: {} for ch in self._CHANNELS
         }
 
+        # Notification queue — unread message counts
+        self._unread_counts: dict[str, int] = {ch: 0 for ch in self._CHANNELS}
+        self._total_unread = 0
+
+        # Last rendered inbox summary, keyed by the unread counts it reflects
+        self._summary_key: tuple | None = None
+        self._summary_str: str = ""
+
     def add_contact(self, agent_id: str, name: str,
                     phone: str | None = None,
                     email: str | None = None,
                     social: dict[str, str] | None = None) -> None:
         """Add or update a contact."""
-        self.contacts[agent_id] = ContactInfo(
-            agent_id=agent_id,
-            name=name,
-            phone_number=phone,
-            email=email,
-            social_handles=social or {},
-        )
+        self.contacts[agent_id] = ContactInfo(agent_id, name, phone, email,
+                                              social or {})
 
     def receive_message(self, message: "Message") -> None:
         """Receive a delivered message into the appropriate inbox.
@@ -108,52 +135,80 @@ class Smartphone:
 
         channel = message.channel
         if channel in self.inbox:
-            self.inbox[channel].append(message)
-            self._unread_counts[channel] = self._unread_counts.get(channel, 0) + 1
+            inbox = self.inbox[channel]
+            if len(inbox) == inbox.maxlen:
+                self._evict(inbox[0])
+            inbox.append(message)
+
+            other = (message.sender_id if message.recipient_id == self.owner_id
+                     else message.recipient_id)
+            thread = self._threads.get((other, channel))
+            if thread is None:
+                thread = self._threads[(other, channel)] = deque(
+                    maxlen=ARCANE_INBOX_MAXLEN)
+            thread.append(message)
+            if not message.read:
+                self._unread_by_channel[channel][message.id] = message
+                self._unread_counts[channel] += 1
+                self._total_unread += 1
+
+    def _evict(self, message: "Message") -> None:
+        """Drop unread bookkeeping for a message about to fall out of the inbox."""
+        pending = self._unread_by_channel[message.channel]
+        if pending.pop(message.id, None) is not None:
+            self._unread_counts[message.channel] -= 1
+            self._total_unread -= 1
 
     def get_unread(self, channel: str | None = None) -> list["Message"]:
         """Get unread messages, optionally filtered by channel."""
-        unread = []
-        channels = [channel] if channel else list(self.inbox.keys())
-        for ch in channels:
-            for msg in self.inbox.get(ch, []):
-                if not msg.read:
-                    unread.append(msg)
-        return unread
+        if channel:
+            return list(self._unread_by_channel.get(channel, {}).values())
+        unread_by_channel = self._unread_by_channel
+        return [msg for ch in self._CHANNELS
+                for msg in unread_by_channel[ch].values()]
 
     def get_all_unread_count(self) -> int:
         """Total unread across all channels."""
-        return sum(self._unread_counts.values())
+        return self._total_unread
 
     def mark_read(self, message: "Message") -> None:
         """Mark a message as read."""
         message.read = True
-        ch = message.channel
-        if ch in self._unread_counts and self._unread_counts[ch] > 0:
-            self._unread_counts[ch] -= 1
+        pending = self._unread_by_channel.get(message.channel)
+        # Only count messages still in the unread index, so repeat calls are no-ops
+        if pending is not None and pending.pop(message.id, None) is not None:
+            self._unread_counts[message.channel] -= 1
+            self._total_unread -= 1
 
     def get_inbox_summary(self) -> str:
         """
         Human-readable inbox summary for LLM prompt injection.
         E.g. "You have 2 unread SMS and 1 unread email."
         """
+        key = tuple(self._unread_counts.values())
+        if key == self._summary_key:
+            return self._summary_str
+
         parts = []
         for ch, count in self._unread_counts.items():
             if count > 0:
-                ch_name = ch.upper() if ch == "sms" else ch.replace("_", " ").title()
-                parts.append(f"{count} unread {ch_name}")
+                parts.append(f"{count} unread {_CH_DISPLAY.get(ch, ch)}")
         if parts:
-            return "Your phone shows: " + ", ".join(parts) + "."
-        return "Your phone has no new notifications."
+            summary = "Your phone shows: " + ", ".join(parts) + "."
+        else:
+            summary = "Your phone has no new notifications."
+
+        self._summary_key = key
+        self._summary_str = summary
+        return summary
 
     def get_recent_thread(self, other_agent_id: str, channel: str,
                           n: int = 10) -> list["Message"]:
         """Get the last N messages in a thread with another agent."""
-        thread = [
-            m for m in self.inbox.get(channel, [])
-            if m.sender_id == other_agent_id or m.recipient_id == other_agent_id
-        ]
-        return thread[-n:]
+        thread = self._threads.get((other_agent_id, channel))
+        if not thread:
+            return []
+        return list(islice(thread, max(len(thread) - n, 0), None))
 
     def knows_contact(self, agent_id: str) -> bool:
         """Check if this agent has contact info for another agent."""
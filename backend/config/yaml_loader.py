@@ -0,0 +1,37 @@
+"""
+ARCANE YAML Loading
+
+Settings, scenarios and personas all parse through here, using libyaml's
+C loader when PyYAML was built with it.
+"""
+
+import os
+from functools import lru_cache
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+def load_yaml(path) -> dict:
+    """Parse a YAML file; an empty file gives {}."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+
+def load_yaml_cached(path) -> dict:
+    """Parse a YAML file, reusing the previous parse until the file changes.
+
+    The dict is shared by every caller — treat it as read-only (or copy it).
+    """
+    path = os.fspath(path)
+    return _load_yaml_version(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_version(path: str, mtime_ns: int) -> dict:
+    """load_yaml keyed on modification time, so an edit invalidates the entry."""
+    return load_yaml(path)
@@ -0,0 +1,168 @@
+"""
+ARCANE LLM Completion Cache
+
+Process-wide LRU of completions keyed by everything that determines a
+request (provider, model, system prompt, messages, temperature, token cap).
+Identical prompts are answered from memory instead of another API round-trip.
+
+Only deterministic (temperature 0) requests are cached by default: reusing a
+sampled reply would hand agents with the same prompt byte-identical output
+and change simulation behaviour. Set ARCANE_LLM_CACHE_SAMPLED=1 to cache
+sampled requests too. ArcaneModel.close() clears the cache.
+
+Concurrent identical requests share a single in-flight call ("single
+flight"): async callers on one event loop await the same task, sync callers
+in other threads wait on the first caller's future. Error strings are never
+cached, so a failed call is retried next time.
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import wraps
+
+# Maximum cached completions (0 disables caching)
+LLM_CACHE_SIZE = int(os.getenv("ARCANE_LLM_CACHE_SIZE", "4096"))
+
+# Also cache temperature > 0 requests (off: sampled replies stay independent)
+LLM_CACHE_SAMPLED = os.getenv("ARCANE_LLM_CACHE_SAMPLED", "").strip().lower() in (
+    "1", "true", "yes", "on")
+
+
+class AsyncLRU:
+    """Thread-safe LRU map of completion key -> response text."""
+
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> task computing it, so duplicate callers await one request
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._inflight_sync: dict[str, Future] = {}
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        # Don't remember failures or blanks
+        if not value or value.startswith("[LLM Error:"):
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_cache = AsyncLRU()
+
+
+def clear_cache() -> None:
+    """Forget every cached completion (e.g. when a simulation ends)."""
+    _cache.clear()
+
+
+def _cacheable(temperature: float) -> bool:
+    """Whether a request's reply may be reused for an identical request."""
+    return LLM_CACHE_SAMPLED or temperature == 0
+
+
+def _completion_key(provider, system_prompt: str, messages: list[dict],
+                    temperature: float, max_tokens: int) -> str:
+    """Stable digest of a completion request."""
+    raw = json.dumps(
+        [type(provider).__name__, provider.model_name, system_prompt,
+         messages, temperature, max_tokens],
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def async_memoize(fn):
+    """Cache an async ``complete(system_prompt, messages, temperature, max_tokens)``."""
+    if LLM_CACHE_SIZE <= 0:
+        return fn
+
+    @wraps(fn)
+    async def wrapper(self, system_prompt: str, messages: list[dict],
+                      temperature: float = 0.7,
+                      max_tokens: int = 1024) -> str:
+        if not _cacheable(temperature):
+            return await fn(self, system_prompt, messages, temperature, max_tokens)
+        key = _completion_key(self, system_prompt, messages,
+                              temperature, max_tokens)
+        hit = _cache.get(key)
+        if hit is not None:
+            return hit
+
+        # Join an identical request already running on this loop; tasks on
+        # other loops (complete_sync in another thread) can't be awaited here
+        loop = asyncio.get_running_loop()
+        task = _cache._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(
+                fn(self, system_prompt, messages, temperature, max_tokens))
+            _cache._inflight[key] = task
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            if task.done() and _cache._inflight.get(key) is task:
+                del _cache._inflight[key]
+        _cache.put(key, result)
+        return result
+
+    return wrapper
+
+
+def memoize(fn):
+    """Cache a synchronous ``complete_sync(...)`` in the same store."""
+    if LLM_CACHE_SIZE <= 0:
+        return fn
+
+    @wraps(fn)
+    def wrapper(self, system_prompt: str, messages: list[dict],
+                temperature: float = 0.7,
+                max_tokens: int = 1024) -> str:
+        if not _cacheable(temperature):
+            return fn(self, system_prompt, messages, temperature, max_tokens)
+        key = _completion_key(self, system_prompt, messages,
+                              temperature, max_tokens)
+        with _cache._lock:
+            hit = _cache._data.get(key)
+            if hit is not None:
+                _cache._data.move_to_end(key)
+                return hit
+            # First caller for this key runs the request; the rest wait on it
+            future = _cache._inflight_sync.get(key)
+            leader = future is None
+            if leader:
+                future = _cache._inflight_sync[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(self, system_prompt, messages, temperature, max_tokens)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            _cache.put(key, result)
+            future.set_result(result)
+        finally:
+            with _cache._lock:
+                del _cache._inflight_sync[key]
+        return result
+
+    return wrapper
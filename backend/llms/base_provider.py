@@ -5,12 +5,37 @@ Abstract interface for LLM providers (Gemini, OpenRouter, OpenAI).
 All agent reasoning goes through this abstraction.
 """
 
+import asyncio
+import concurrent.futures
+import threading
 from abc import ABC, abstractmethod
 
+try:
+    from blake3 import blake3 as _embed_hash
+except ImportError:  # blake3 is optional; SHA-256 is hardware-accelerated on most CPUs
+    from hashlib import sha256 as _embed_hash
+
+# Longest complete_sync waits on the shared loop before giving up (seconds);
+# generous enough to cover a provider's own timeout plus its retries
+COMPLETE_SYNC_TIMEOUT = 600.0
+
+
+def pseudo_embedding(text: str) -> list[float]:
+    """Deterministic 32-dim placeholder embedding for providers without one.
+
+    Scales the raw digest bytes to [0, 1] directly rather than round-tripping
+    through a hex string.
+    """
+    return [b / 255.0 for b in _embed_hash(text.encode()).digest()]
+
 
 class BaseProvider(ABC):
     """Abstract LLM provider interface."""
 
+    # Long-lived event loop (running in another thread) that complete_sync
+    # submits to, if the owner provided one via use_loop()
+    _loop: asyncio.AbstractEventLoop | None = None
+
     @abstractmethod
     async def complete(self, system_prompt: str, messages: list[dict],
                        temperature: float = 0.7,
@@ -42,16 +67,45 @@ class BaseProvider(ABC):
         """
         ...
 
+    async def aclose(self) -> None:
+        """Release any pooled connections. No-op unless a subclass pools."""
+
+    def use_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Run complete_sync on a long-lived loop so pooled clients survive calls."""
+        self._loop = loop
+
     def complete_sync(self, system_prompt: str, messages: list[dict],
                       temperature: float = 0.7,
                       max_tokens: int = 1024) -> str:
         """Synchronous wrapper for complete(). Used in Mesa's step()."""
-        import asyncio
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                on_loop = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop = False
+            # Blocking on the loop from its own thread would deadlock
+            if not on_loop:
+                coro = self.complete(system_prompt, messages,
+                                     temperature, max_tokens)
+                try:
+                    future = asyncio.run_coroutine_threadsafe(coro, loop)
+                except RuntimeError:
+                    # Loop closed since the check above; run it locally instead
+                    coro.close()
+                else:
+                    try:
+                        return future.result(timeout=COMPLETE_SYNC_TIMEOUT)
+                    except concurrent.futures.TimeoutError:
+                        future.cancel()
+                        return (f"[LLM Error: no response after "
+                                f"{COMPLETE_SYNC_TIMEOUT:.0f}s]")
+                    except concurrent.futures.CancelledError:
+                        return "[LLM Error: request cancelled during shutdown]"
         try:
             loop = asyncio.get_event_loop()
             if loop.is_running():
                 # If we're in an async context, use nest_asyncio pattern
-                import concurrent.futures
                 with concurrent.futures.ThreadPoolExecutor() as pool:
                     future = pool.submit(
                         asyncio.run,
@@ -69,3 +123,39 @@ class BaseProvider(ABC):
                 self.complete(system_prompt, messages,
                               temperature, max_tokens)
             )
+
+
+class PooledHTTPProvider(BaseProvider):
+    """Provider that talks to its API through a pooled httpx.AsyncClient."""
+
+    # (event loop, client created on it); replaced as one tuple so readers
+    # never pair a client with the wrong loop
+    _http_pool: tuple | None = None
+    _http_pool_lock = threading.Lock()  # shared; held only to build or drop a client
+
+    @abstractmethod
+    def _make_async_client(self):
+        """Build a new pooled httpx.AsyncClient for the running loop."""
+        ...
+
+    def _async_client(self):
+        """Return the pooled client, rebuilding it if the running loop changed.
+
+        httpx clients can't be shared across event loops, so a client left
+        over from a loop that has since been replaced is simply dropped.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._http_pool
+        if pool is None or pool[0] is not loop:
+            with self._http_pool_lock:
+                pool = self._http_pool
+                if pool is None or pool[0] is not loop:
+                    pool = self._http_pool = (loop, self._make_async_client())
+        return pool[1]
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one is open on this loop."""
+        with self._http_pool_lock:
+            pool, self._http_pool = self._http_pool, None
+        if pool is not None and pool[0] is asyncio.get_running_loop():
+            await pool[1].aclose()
@@ -6,10 +6,12 @@ Uses the new google-genai SDK (replaces deprecated google-generativeai).
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from backend.llms._cache import async_memoize, memoize
 from backend.llms.base_provider import BaseProvider
 
 # Load .env from project root
@@ -19,6 +21,27 @@ load_dotenv(_project_root / ".env")
 logger = logging.getLogger("root.llm.gemini")
 
 
+@lru_cache(maxsize=4096)
+def _content(role: str, text: str):
+    """Build (once) the Content for a message; history turns repeat every call.
+
+    Cached objects are shared between requests — never mutate them.
+    """
+    from google.genai import types
+    return types.Content(role=role, parts=[types.Part(text=text)])
+
+
+@lru_cache(maxsize=64)
+def _generation_config(system_prompt: str, temperature: float, max_tokens: int):
+    """Build (once) the request config for a system prompt and sampling setup."""
+    from google.genai import types
+    return types.GenerateContentConfig(
+        system_instruction=system_prompt or None,
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+    )
+
+
 class GeminiProvider(BaseProvider):
     """Google Gemini API provider (google-genai SDK)."""
 
@@ -35,36 +58,21 @@ class GeminiProvider(BaseProvider):
 
     def _build_contents(self, messages: list[dict]):
         """Build genai Content objects from message dicts."""
-        from google.genai import types
-
-        contents = []
-        for msg in messages:
-            role = "user" if msg["role"] == "user" else "model"
-            contents.append(
-                types.Content(
-                    role=role,
-                    parts=[types.Part(text=msg["content"])],
-                )
-            )
-        return contents
+        return [_content("user" if msg["role"] == "user" else "model", msg["content"])
+                for msg in messages]
 
+    @memoize
     def complete_sync(self, system_prompt: str, messages: list[dict],
                       temperature: float = 0.7,
                       max_tokens: int = 1024) -> str:
         """Generate a completion via Gemini (synchronous — no event loop needed)."""
         try:
-            from google.genai import types
-
             contents = self._build_contents(messages)
 
             response = self._client.models.generate_content(
                 model=self.model_name,
                 contents=contents,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt or None,
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                ),
+                config=_generation_config(system_prompt, temperature, max_tokens),
             )
 
             return response.text
@@ -73,23 +81,18 @@ class GeminiProvider(BaseProvider):
             logger.error(f"Gemini completion error: {e}")
             return f"[LLM Error: {e}]"
 
+    @async_memoize
     async def complete(self, system_prompt: str, messages: list[dict],
                        temperature: float = 0.7,
                        max_tokens: int = 1024) -> str:
         """Generate a completion via Gemini (async)."""
         try:
-            from google.genai import types
-
             contents = self._build_contents(messages)
 
             response = await self._client.aio.models.generate_content(
                 model=self.model_name,
                 contents=contents,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt or None,
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                ),
+                config=_generation_config(system_prompt, temperature, max_tokens),
             )
 
             return response.text
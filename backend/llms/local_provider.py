@@ -11,12 +11,14 @@ import os
 import re
 import logging
 import asyncio
+import threading
 from pathlib import Path
 
 import httpx
 from dotenv import load_dotenv
 
-from backend.llms.base_provider import BaseProvider
+from backend.llms._cache import async_memoize, memoize
+from backend.llms.base_provider import PooledHTTPProvider, pseudo_embedding
 
 # Load .env from project root
 _project_root = Path(__file__).resolve().parent.parent.parent
@@ -28,8 +30,12 @@ logger = logging.getLogger("root.llm.local")
 MAX_RETRIES = 2
 RETRY_BASE_DELAY = 1.0  # seconds
 
+# Connection pool limits shared by the sync and async clients
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20,
+                           keepalive_expiry=30.0)
 
-class LocalLLMProvider(BaseProvider):
+
+class LocalLLMProvider(PooledHTTPProvider):
     """Local LLM provider via OpenAI-compatible API (LM Studio, Ollama, etc.)."""
 
     def __init__(self, model: str = "llama-3.1-8b-instruct",
@@ -48,9 +54,38 @@ class LocalLLMProvider(BaseProvider):
         self.timeout = timeout
         self.embedding_model = embedding_model
 
+        # Pooled client for complete_sync (httpx.Client is thread-safe),
+        # created on first use under the lock
+        self._sync_client: httpx.Client | None = None
+        self._sync_client_lock = threading.Lock()
+
         logger.info(f"LocalLLMProvider initialized: model={model}, "
                     f"base_url={self.base_url}, timeout={timeout}s")
 
+    def _make_async_client(self) -> httpx.AsyncClient:
+        """Pooled client: keeps the local server connection alive between calls."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Content-Type": "application/json"},
+            limits=HTTP_LIMITS,
+            timeout=self.timeout,
+        )
+
+    def _client(self) -> httpx.Client:
+        """Return the pooled synchronous client, creating it on first use."""
+        client = self._sync_client
+        if client is None:
+            with self._sync_client_lock:
+                client = self._sync_client
+                if client is None:
+                    client = self._sync_client = httpx.Client(
+                        base_url=self.base_url,
+                        headers={"Content-Type": "application/json"},
+                        limits=HTTP_LIMITS,
+                        timeout=self.timeout,
+                    )
+        return client
+
     @staticmethod
     def _strip_thinking(text: str) -> str:
         """Strip reasoning/chain-of-thought from model output.
@@ -116,6 +151,7 @@ class LocalLLMProvider(BaseProvider):
 
         return cleaned
 
+    @async_memoize
     async def complete(self, system_prompt: str, messages: list[dict],
                        temperature: float = 0.7,
                        max_tokens: int = 1024) -> str:
@@ -130,21 +166,18 @@ class LocalLLMProvider(BaseProvider):
 
         for attempt in range(MAX_RETRIES):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers={"Content-Type": "application/json"},
-                        json={
-                            "model": self.model_name,
-                            "messages": api_messages,
-                            "temperature": temperature,
-                            "max_tokens": max_tokens,
-                            "stream": False,
-                        },
-                        timeout=self.timeout,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
+                response = await self._async_client().post(
+                    "/chat/completions",
+                    json={
+                        "model": self.model_name,
+                        "messages": api_messages,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                        "stream": False,
+                    },
+                )
+                response.raise_for_status()
+                data = response.json()
 
                 return self._strip_thinking(
                     data["choices"][0]["message"]["content"] or ""
@@ -191,6 +224,7 @@ class LocalLLMProvider(BaseProvider):
 
         return f"[LLM Error: {last_error}]"
 
+    @memoize
     def complete_sync(self, system_prompt: str, messages: list[dict],
                       temperature: float = 0.7,
                       max_tokens: int = 1024) -> str:
@@ -215,15 +249,9 @@ class LocalLLMProvider(BaseProvider):
         body["chat_template_kwargs"] = {"enable_thinking": False}
 
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={"Content-Type": "application/json"},
-                    json=body,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = self._client().post("/chat/completions", json=body)
+            response.raise_for_status()
+            data = response.json()
 
             msg = data["choices"][0]["message"]
             raw = msg.get("content") or ""
@@ -270,23 +298,18 @@ class LocalLLMProvider(BaseProvider):
                 "Using hash-based placeholder. Pull an embedding model "
                 "and set 'embedding_model' in settings.yaml for real embeddings."
             )
-            import hashlib
-            h = hashlib.sha256(text.encode()).hexdigest()
-            return [int(h[i:i+2], 16) / 255.0 for i in range(0, 64, 2)]
+            return pseudo_embedding(text)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/embeddings",
-                    headers={"Content-Type": "application/json"},
-                    json={
-                        "model": self.embedding_model,
-                        "input": text,
-                    },
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._async_client().post(
+                "/embeddings",
+                json={
+                    "model": self.embedding_model,
+                    "input": text,
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
 
             return data["data"][0]["embedding"]
 
@@ -294,5 +317,13 @@ class LocalLLMProvider(BaseProvider):
             logger.error(f"Local embedding error: {e}")
             return []
 
+    async def aclose(self) -> None:
+        """Close both pooled clients."""
+        await super().aclose()
+        with self._sync_client_lock:
+            client, self._sync_client = self._sync_client, None
+        if client is not None:
+            client.close()
+
     def __repr__(self) -> str:
         return f"LocalLLMProvider(model={self.model_name}, url={self.base_url})"
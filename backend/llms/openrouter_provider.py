@@ -7,14 +7,23 @@ Uses the OpenRouter API for access to many free/open source models
 
 import os
 import time
+import random
 import logging
 import asyncio
+import importlib.util
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 import httpx
 from dotenv import load_dotenv
 
-from backend.llms.base_provider import BaseProvider
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    from json import dumps as _json_dumps, loads as _json_loads
+
+from backend.llms._cache import async_memoize
+from backend.llms.base_provider import PooledHTTPProvider, pseudo_embedding
 
 # Load .env from project root
 _project_root = Path(__file__).resolve().parent.parent.parent
@@ -27,9 +36,83 @@ OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 # Retry config for free-tier rate limits
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2.0  # seconds
+MAX_RATE_LIMIT_WAIT = 60.0  # cap on server-requested pauses (daily quotas reset hours out)
+
+# Connection pooling for the shared client; HTTP/2 multiplexes concurrent
+# completions over one connection when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100,
+                           keepalive_expiry=30.0)
+HTTP_TIMEOUT = httpx.Timeout(connect=10.0, read=90.0, write=30.0, pool=5.0)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with +/-50% jitter so concurrent retriers spread out."""
+    return min(MAX_RATE_LIMIT_WAIT,
+               RETRY_BASE_DELAY * (2 ** attempt) * (0.5 + random.random()))
+
+
+def _retry_after_seconds(headers) -> float | None:
+    """Seconds to wait according to Retry-After / X-RateLimit-Reset, if given."""
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    reset = headers.get("x-ratelimit-reset")
+    if reset:
+        try:
+            reset_at = float(reset)
+        except ValueError:
+            return None
+        if reset_at > 1e11:  # epoch milliseconds (OpenRouter)
+            reset_at /= 1000.0
+        return max(0.0, reset_at - time.time())
+    return None
+
+
+class _RateLimitBroker:
+    """Rate-limit state shared by every OpenRouter provider using one API key.
+
+    A 429 pauses all callers until the server's reset time instead of each
+    retrying on its own schedule, and a response reporting no remaining
+    requests pauses them pre-emptively. Times are time.monotonic(), so the
+    broker works across the event loops complete_sync may run on.
+    """
+
+    def __init__(self):
+        self.paused_until = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until requests are allowed again.
+
+        Waiters wake up to a second apart so they don't all resume at once.
+        """
+        while (wait := self.paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(wait + random.random())
+
+    def pause(self, seconds: float) -> None:
+        """Hold all callers for the given number of seconds (capped)."""
+        seconds = min(seconds, MAX_RATE_LIMIT_WAIT)
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def observe(self, response: httpx.Response) -> None:
+        """Pause ahead of time once the server reports the window is used up."""
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            delay = _retry_after_seconds(response.headers)
+            if delay:
+                self.pause(delay)
+
+
+# One broker per API key
+_BROKERS: dict[str, _RateLimitBroker] = {}
 
 
-class OpenRouterProvider(BaseProvider):
+class OpenRouterProvider(PooledHTTPProvider):
     """OpenRouter API provider for free/OSS models."""
 
     def __init__(self, model: str = "meta-llama/llama-3.3-70b-instruct:free",
@@ -40,6 +123,27 @@ class OpenRouterProvider(BaseProvider):
         if not self.api_key:
             logger.warning("OPENROUTER_API_KEY not set. LLM calls will fail.")
 
+        self._broker = _BROKERS.setdefault(self.api_key, _RateLimitBroker())
+
+        # Static request headers, set once on every pooled client
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://arcane-sim.local",
+            "X-Title": "ARCANE Simulation",
+        }
+
+    def _make_async_client(self) -> httpx.AsyncClient:
+        """Pooled client: keeps TLS connections alive between completions."""
+        return httpx.AsyncClient(
+            base_url=OPENROUTER_BASE_URL,
+            headers=self._headers,
+            http2=HTTP2_AVAILABLE,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,  # Free tier can be slow to answer
+        )
+
+    @async_memoize
     async def complete(self, system_prompt: str, messages: list[dict],
                        temperature: float = 0.7,
                        max_tokens: int = 1024) -> str:
@@ -54,43 +158,48 @@ class OpenRouterProvider(BaseProvider):
 
         for attempt in range(MAX_RETRIES):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{OPENROUTER_BASE_URL}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json",
-                            "HTTP-Referer": "https://arcane-sim.local",
-                            "X-Title": "ARCANE Simulation",
-                        },
-                        json={
-                            "model": self.model_name,
-                            "messages": api_messages,
-                            "temperature": temperature,
-                            "max_tokens": max_tokens,
-                        },
-                        timeout=90.0,  # Free tier can be slow
-                    )
-
-                    # Handle rate limits
-                    if response.status_code == 429:
-                        delay = RETRY_BASE_DELAY * (2 ** attempt)
-                        logger.warning(f"OpenRouter rate limited. "
-                                      f"Retrying in {delay}s (attempt {attempt + 1})")
-                        await asyncio.sleep(delay)
-                        continue
-
-                    response.raise_for_status()
-                    data = response.json()
+                await self._broker.acquire()
+                response = await self._async_client().post(
+                    "/chat/completions",
+                    content=_json_dumps({
+                        "model": self.model_name,
+                        "messages": api_messages,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                    }),
+                )
+
+                self._broker.observe(response)
+
+                # Handle rate limits: pause every caller sharing this key
+                # until the server says the window resets
+                if response.status_code == 429:
+                    last_error = "rate limited (429)"
+                    if attempt == MAX_RETRIES - 1:
+                        # Giving up: don't stall the other callers for nothing
+                        logger.error(f"OpenRouter completion failed after "
+                                     f"{MAX_RETRIES} attempts: {last_error}")
+                        break
+                    # Never retry before the server's reset time (capped as pause() does)
+                    delay = min(MAX_RATE_LIMIT_WAIT,
+                                max(_backoff_delay(attempt),
+                                    _retry_after_seconds(response.headers) or 0.0))
+                    logger.warning(f"OpenRouter rate limited. "
+                                  f"Retrying in {delay:.1f}s (attempt {attempt + 1})")
+                    self._broker.pause(delay)
+                    continue
+
+                response.raise_for_status()
+                data = _json_loads(response.content)
 
                 return data["choices"][0]["message"]["content"]
 
             except Exception as e:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_BASE_DELAY * (2 ** attempt)
+                    delay = _backoff_delay(attempt)
                     logger.warning(f"OpenRouter error: {e}. "
-                                  f"Retrying in {delay}s (attempt {attempt + 1})")
+                                  f"Retrying in {delay:.1f}s (attempt {attempt + 1})")
                     await asyncio.sleep(delay)
                 else:
                     logger.error(f"OpenRouter completion failed after "
@@ -105,9 +214,7 @@ class OpenRouterProvider(BaseProvider):
         """
         logger.warning("OpenRouter does not support embeddings. "
                        "Using placeholder.")
-        import hashlib
-        h = hashlib.sha256(text.encode()).hexdigest()
-        return [int(h[i:i+2], 16) / 255.0 for i in range(0, 64, 2)]
+        return pseudo_embedding(text)
 
     def __repr__(self) -> str:
         return f"OpenRouterProvider(model={self.model_name})"
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     """A single memory entry in the stream."""
     id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -93,24 +93,57 @@ class MemoryStream:
         if not self.memories:
             return []
 
-        scored = []
         query_keywords = set(w.lower() for w in query.split() if len(w) > 3)
 
+        # Pick the specialized scoring loop once, not per memory
+        if query_embedding:
+            scored = self._score_with_embedding(
+                query_keywords, query_embedding, current_step)
+        else:
+            scored = self._score_keywords(query_keywords, current_step)
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [mem for _, mem in scored[:n]]
+
+    def _score_keywords(self, query_keywords: set[str],
+                        current_step: int) -> list[tuple[float, Memory]]:
+        """Score memories by keyword overlap only (no query embedding)."""
+        scored = []
+        n_query = max(len(query_keywords), 1)
+
         for mem in self.memories:
-            # Recency score: exponential decay
-            steps_ago = current_step - mem.created_step
-            recency = self.decay_factor ** steps_ago
+            recency = self.decay_factor ** (current_step - mem.created_step)
+            importance = mem.importance / 10.0
 
-            # Importance score: normalize to 0-1
+            if query_keywords and mem.keywords:
+                relevance = len(query_keywords.intersection(mem.keywords)) / n_query
+            else:
+                relevance = 0.0
+
+            score = (self.recency_weight * recency +
+                     self.importance_weight * importance +
+                     self.relevance_weight * relevance)
+            scored.append((score, mem))
+
+            # Update last accessed
+            mem.last_accessed = current_step
+
+        return scored
+
+    def _score_with_embedding(self, query_keywords: set[str],
+                              query_embedding: list[float],
+                              current_step: int) -> list[tuple[float, Memory]]:
+        """Score memories using keyword overlap, falling back to cosine similarity."""
+        scored = []
+        n_query = max(len(query_keywords), 1)
+
+        for mem in self.memories:
+            recency = self.decay_factor ** (current_step - mem.created_step)
             importance = mem.importance / 10.0
 
-            # Relevance score: keyword overlap
             if query_keywords and mem.keywords:
-                mem_keywords = set(mem.keywords)
-                overlap = len(query_keywords & mem_keywords)
-                relevance = overlap / max(len(query_keywords), 1)
-            elif query_embedding and mem.embedding:
-                # Cosine similarity if embeddings available
+                relevance = len(query_keywords.intersection(mem.keywords)) / n_query
+            elif mem.embedding:
                 relevance = self._cosine_similarity(query_embedding, mem.embedding)
             else:
                 relevance = 0.0
@@ -118,14 +151,12 @@ class MemoryStream:
             score = (self.recency_weight * recency +
                      self.importance_weight * importance +
                      self.relevance_weight * relevance)
-
             scored.append((score, mem))
 
             # Update last accessed
             mem.last_accessed = current_step
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [mem for _, mem in scored[:n]]
+        return scored
 
     def get_recent(self, n: int = 20) -> list[Memory]:
         """Get the N most recent memories."""
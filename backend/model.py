@@ -7,21 +7,42 @@ data collection, event logging, and simulation clock.
 
 import os
 import mesa
-import yaml
+import asyncio
+import importlib
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 
 from backend.research.event_logger import EventLogger, SimEvent, EventType
 from backend.research.sim_recorder import SimRecorder
 from backend.channels.router import ChannelRouter
+from backend.channels.smartphone import ContactInfo
 from backend.agents.benign_agent import BenignAgent
 from backend.agents.deviant_agent import DeviantAgent
+from backend.llms._cache import clear_cache as clear_completion_cache
 from backend.llms.base_provider import BaseProvider
 from backend.agents.personas.loader import load_persona
+from backend.config.yaml_loader import load_yaml_cached
 
 logger = logging.getLogger("root.model")
 
+_DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config", "settings.yaml")
+
+# provider name -> (module, class), imported on first use
+_PROVIDER_MODULES = {
+    "gemini": ("backend.llms.gemini_provider", "GeminiProvider"),
+    "openrouter": ("backend.llms.openrouter_provider", "OpenRouterProvider"),
+    "local": ("backend.llms.local_provider", "LocalLLMProvider"),
+}
+_PROVIDER_CLASSES: dict[str, type[BaseProvider]] = {}
+
+# Initial trust by pre-defined relationship type
+TRUST_DEFAULTS = {"friend": 0.7, "family": 0.85, "neighbor": 0.6, "acquaintance": 0.5}
+DEFAULT_RELATIONSHIP_TRUST = 0.5
+
 
 # Locations decoded from the Tiled map spawning_location_maze
 DEFAULT_LOCATIONS = {
@@ -40,6 +61,35 @@ DEFAULT_LOCATIONS = {
 }
 
 
+async def _cancel_pending_tasks() -> None:
+    """Cancel every other task on the running loop and wait for them to finish."""
+    current = asyncio.current_task()
+    tasks = [t for t in asyncio.all_tasks() if t is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Most recent events kept in the dashboard snapshot (the /api/events cap)
+SNAPSHOT_RECENT_EVENTS = 200
+
+
+@dataclass(slots=True, frozen=True)
+class VizSnapshot:
+    """Dashboard view of the model, rebuilt once per step.
+
+    The server reads this instead of walking agents and the event log on
+    every poll. Replaced wholesale, so readers always see one consistent step.
+    """
+    step: int
+    sim_time: str
+    msg_count: int
+    reveal_count: int
+    tactic_count: int
+    recent: tuple[dict, ...]   # serialized events, oldest first
+    agents: tuple[tuple, ...]  # (id, name, type, pos, pronunciatio, activity, location)
+
+
 class ArcaneModel(mesa.Model):
     """
     The ARCANE simulation model.
@@ -76,6 +126,9 @@ class ArcaneModel(mesa.Model):
             minutes=self.config.get("simulation", {}).get(
                 "sim_time_per_step_minutes", 10)
         )
+        self._sim_time_cache_step = -1
+        self._sim_time_cache: datetime = self.sim_start_time
+        self._sim_time_str_cache = ""
 
         # Event logger (active logs for every step)
         self.event_logger = EventLogger(
@@ -108,14 +161,24 @@ class ArcaneModel(mesa.Model):
         # LLM providers (lazy-initialized)
         self._llm_providers: dict[str, BaseProvider] = {}
 
+        # Event loop for async LLM work, run in a background thread and
+        # started with the first provider that submits to it (see get_llm_for_agent)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+        # Held for the whole of step() and close(), so closing waits for a
+        # step in progress (and its reflection workers) to finish
+        self._step_lock = threading.Lock()
+        self.closed = False
+
         # Mesa DataCollector for metrics
         self.datacollector = mesa.DataCollector(
             model_reporters={
                 "step": lambda m: m.step_count,
-                "total_messages": lambda m: len(m.event_logger.get_events_by_type(
-                    EventType.MESSAGE_SENT)),
-                "info_reveals": lambda m: len(m.event_logger.get_events_by_type(
-                    EventType.INFORMATION_REVEALED)),
+                "total_messages": lambda m: m.event_logger.count_by_type(
+                    EventType.MESSAGE_SENT),
+                "info_reveals": lambda m: m.event_logger.count_by_type(
+                    EventType.INFORMATION_REVEALED),
             },
             agent_reporters={
                 "location": lambda a: getattr(a, 'current_location_name', ''),
@@ -124,6 +187,20 @@ class ArcaneModel(mesa.Model):
             },
         )
 
+        # Collect metrics every N steps (1 = every step)
+        self._collect_stride = max(1, self.config.get("simulation", {}).get(
+            "collect_every_n_steps", 1))
+
+        # Agent activation order, reshuffled every N steps
+        self._reshuffle_stride = max(1, self.config.get("simulation", {}).get(
+            "reshuffle_every_n_steps", 5))
+        self._activation_order: list = []
+
+        # Reflections due this step, run together once every agent has acted
+        self._pending_reflections: list = []
+        self._reflection_workers = max(1, self.config.get("memory", {}).get(
+            "parallel_reflections", 4))
+
         # Create agents from scenario
         self._create_agents()
 
@@ -143,18 +220,30 @@ class ArcaneModel(mesa.Model):
         if self.recorder:
             self.recorder.init_recording(self)
 
+        self.snapshot = self._build_snapshot()
+
         logger.info(f"ARCANE Model initialized: {len(self.agents_by_id)} agents, "
                      f"{len(self.location_names)} locations")
 
+    def _refresh_sim_time(self) -> None:
+        """Recompute the cached clock values if the step has advanced."""
+        if self._sim_time_cache_step != self.step_count:
+            self._sim_time_cache = (self.sim_start_time
+                                    + self.sim_time_per_step * self.step_count)
+            self._sim_time_str_cache = self._sim_time_cache.strftime("%A %I:%M %p")
+            self._sim_time_cache_step = self.step_count
+
     @property
     def sim_time(self) -> datetime:
         """Current in-simulation time."""
-        return self.sim_start_time + (self.sim_time_per_step * self.step_count)
+        self._refresh_sim_time()
+        return self._sim_time_cache
 
     @property
     def sim_time_str(self) -> str:
         """Current simulation time as a formatted string."""
-        return self.sim_time.strftime("%A %I:%M %p")
+        self._refresh_sim_time()
+        return self._sim_time_str_cache
 
     def step(self):
         """
@@ -162,10 +251,20 @@ class ArcaneModel(mesa.Model):
 
         1. Log step start
         2. Deliver pending async messages
-        3. Activate all agents (shuffled order)
-        4. Collect data
-        5. Log step end
+        3. Activate all agents (shuffled order, refreshed every N steps)
+        4. Run reflections that came due, concurrently
+        5. Collect data
+        6. Log step end
+
+        Does nothing once the model is closed.
         """
+        with self._step_lock:
+            if self.closed:
+                return
+            self._step()
+
+    def _step(self) -> None:
+        """Body of step(), run with the step lock held."""
         self.step_count += 1
         sim_time = self.sim_time_str
 
@@ -173,18 +272,29 @@ class ArcaneModel(mesa.Model):
         self.event_logger.log_step_start(self.step_count, sim_time)
 
         # Deliver pending asynchronous messages (SMS, email, DM)
-        delivered = self.channel_router.deliver_pending(
+        delivered = self.channel_router.deliver_pending_count(
             self.step_count, sim_time, self.agents_by_id
         )
         if delivered:
-            logger.info(f"Step {self.step_count}: Delivered {len(delivered)} "
+            logger.info(f"Step {self.step_count}: Delivered {delivered} "
                         f"pending messages")
 
-        # Activate all agents in random order
-        self.agents.shuffle_do("step")
+        # Activate all agents in random order (order refreshed every N steps)
+        if (not self._activation_order
+                or len(self._activation_order) != len(self.agents)
+                or self.step_count % self._reshuffle_stride == 0):
+            self._activation_order = list(self.agents)
+            self.random.shuffle(self._activation_order)
+        for agent in self._activation_order:
+            agent.step()
+
+        # Run due reflections concurrently (each touches only its own agent)
+        if self._pending_reflections:
+            self._run_reflections()
 
         # Collect data
-        self.datacollector.collect(self)
+        if self.step_count % self._collect_stride == 0:
+            self.datacollector.collect(self)
 
         # Step end log
         self.event_logger.log_step_end(self.step_count, sim_time)
@@ -193,6 +303,66 @@ class ArcaneModel(mesa.Model):
         if self.recorder:
             self.recorder.capture_step(self)
 
+        # Publish the dashboard view for this step
+        self.snapshot = self._build_snapshot()
+
+    def _build_snapshot(self) -> VizSnapshot:
+        """Collect everything the dashboard renders in a single pass."""
+        event_logger = self.event_logger
+        count = event_logger.count_by_type
+        agents = []
+        for agent_id, agent in self.agents_by_id.items():
+            pos = getattr(agent, 'current_tile', (0, 0))
+            agents.append((
+                agent_id,
+                getattr(agent, 'name', 'Unknown'),
+                getattr(agent, 'agent_type', 'benign'),
+                list(pos) if pos else [0, 0],
+                getattr(agent, 'pronunciatio', '💬'),
+                getattr(agent, 'current_activity', 'idle')[:60],
+                getattr(agent, 'current_location_name', ''),
+            ))
+        return VizSnapshot(
+            step=self.step_count,
+            sim_time=self.sim_time_str,
+            msg_count=count(EventType.MESSAGE_SENT),
+            reveal_count=count(EventType.INFORMATION_REVEALED),
+            tactic_count=count(EventType.TACTIC_USED),
+            recent=tuple(
+                {
+                    "step": e.step,
+                    "type": e.event_type.value,
+                    "timestamp": e.timestamp,
+                    "agent": e.agent_id or "",
+                    "target": e.target_id or "",
+                    "content": e.content,
+                }
+                for e in event_logger.get_recent_events(SNAPSHOT_RECENT_EVENTS)
+            ),
+            agents=tuple(agents),
+        )
+
+    def schedule_reflection(self, agent) -> None:
+        """Queue an agent's reflection for the end of the current step."""
+        self._pending_reflections.append(agent)
+
+    def _run_reflections(self) -> None:
+        """Run queued reflections, overlapping their LLM round-trips."""
+        agents, self._pending_reflections = self._pending_reflections, []
+        workers = min(len(agents), self._reflection_workers)
+        if workers == 1:
+            for agent in agents:
+                agent.reflect()
+            return
+        # Resolve providers (and start the shared loop) here, so workers never
+        # race to lazily create them
+        for agent in agents:
+            agent.llm
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="reflect") as pool:
+            # reflect() handles its own errors; list() waits for completion
+            list(pool.map(lambda agent: agent.reflect(), agents))
+
     def _create_agents(self) -> None:
         """Create agents from config or scenario definition.
 
@@ -237,6 +407,10 @@ class ArcaneModel(mesa.Model):
                 # 3. Hardcoded fallback
                 agent_defs = self._default_agents()
 
+        # Roster composition, counted as agents are created
+        self.deviant_count = 0
+        self.benign_count = 0
+
         for agent_def in agent_defs:
             agent_id = agent_def.get("id", f"agent_{len(self.agents_by_id)}")
             agent_type = agent_def.get("type", "benign")
@@ -247,8 +421,10 @@ class ArcaneModel(mesa.Model):
 
             if agent_type == "deviant":
                 agent = DeviantAgent(self, agent_id, persona_data)
+                self.deviant_count += 1
             else:
                 agent = BenignAgent(self, agent_id, persona_data)
+                self.benign_count += 1
 
             # Place on grid at exact house tile
             location_id = agent_def.get("starting_location", "adam_smiths_house")
@@ -261,29 +437,34 @@ class ArcaneModel(mesa.Model):
 
             self.agents_by_id[agent_id] = agent
 
-            logger.info(f"Created {agent_type} agent: {agent.name} "
-                        f"at {location_id} {tile}")
+            logger.debug(f"Created {agent_type} agent: {agent.name} "
+                         f"at {location_id} {tile}")
+
+        logger.info("Created %d agents", len(self.agents_by_id))
 
-        # Exchange contact info between all agents (they're in the same town)
+        # Exchange contact info between all agents (they're in the same town).
+        # One card per agent, shared read-only across every contact book.
         all_agents = list(self.agents_by_id.values())
+        cards = {
+            b.agent_id: ContactInfo(
+                agent_id=b.agent_id,
+                name=b.name,
+                phone_number=b.smartphone.phone_number,
+                email=b.smartphone.email_address,
+                social_handles=b.smartphone.social_handles,
+            )
+            for b in all_agents
+        }
         for a in all_agents:
-            for b in all_agents:
-                if a != b:
-                    a.smartphone.add_contact(
-                        agent_id=b.agent_id,
-                        name=b.name,
-                        phone=b.smartphone.phone_number,
-                        email=b.smartphone.email_address,
-                        social={k: v for k, v in b.smartphone.social_handles.items()},
-                    )
+            a.smartphone.contacts.update(cards)
+            del a.smartphone.contacts[a.agent_id]
 
         # Set initial trust levels from pre-defined relationships
-        trust_defaults = {"friend": 0.7, "family": 0.85, "neighbor": 0.6, "acquaintance": 0.5}
         for agent in all_agents:
-            for rel in getattr(agent, 'relationships', []):
-                rel_type = rel.get("type", "acquaintance")
-                initial_trust = trust_defaults.get(rel_type, 0.5)
-                agent.trust_register[rel["agent_id"]] = initial_trust
+            trust_register = agent.trust_register
+            for rel in agent.relationships:
+                trust_register[rel["agent_id"]] = TRUST_DEFAULTS.get(
+                    rel.get("type", "acquaintance"), DEFAULT_RELATIONSHIP_TRUST)
 
         # Rewrite deviant target_agents to reference actual benign agent IDs
         # (persona YAMLs may have hardcoded stale IDs like "agent_benign_4")
@@ -309,7 +490,7 @@ class ArcaneModel(mesa.Model):
             return [
                 {
                     "id": "agent_deviant_1", "type": "deviant",
-                    "persona": load_persona("marcus_webb"),
+                    "persona": dict(load_persona("marcus_webb")),
                     "starting_location": "arthur_burtons_apt",
                 },
                 {
@@ -407,35 +588,89 @@ class ArcaneModel(mesa.Model):
         cache_key = f"{provider_name}:{model_name}"
 
         if cache_key not in self._llm_providers:
-            if provider_name == "gemini":
-                from backend.llms.gemini_provider import GeminiProvider
-                self._llm_providers[cache_key] = GeminiProvider(model=model_name)
-            elif provider_name == "openrouter":
-                from backend.llms.openrouter_provider import OpenRouterProvider
-                self._llm_providers[cache_key] = OpenRouterProvider(model=model_name)
-            elif provider_name == "local":
-                from backend.llms.local_provider import LocalLLMProvider
+            provider_cls = _get_provider_class(provider_name)
+            kwargs = {}
+            if provider_name == "local":
                 local_cfg = self.config.get("local_llm", {})
-                self._llm_providers[cache_key] = LocalLLMProvider(
-                    model=model_name,
-                    base_url=local_cfg.get("base_url", "http://localhost:1234/v1"),
-                    timeout=local_cfg.get("timeout", 120),
-                    embedding_model=local_cfg.get("embedding_model"),
-                )
-            else:
-                from backend.llms.gemini_provider import GeminiProvider
-                self._llm_providers[cache_key] = GeminiProvider(model=model_name)
+                kwargs = {
+                    "base_url": local_cfg.get("base_url", "http://localhost:1234/v1"),
+                    "timeout": local_cfg.get("timeout", 120),
+                    "embedding_model": local_cfg.get("embedding_model"),
+                }
+            provider = provider_cls(model=model_name, **kwargs)
+            # Only the base complete_sync submits to the shared loop; providers
+            # with their own sync path never need it started
+            if provider_cls.complete_sync is BaseProvider.complete_sync:
+                provider.use_loop(self._event_loop())
+            self._llm_providers[cache_key] = provider
 
             logger.info(f"LLM provider created: {cache_key} (for {agent_type})")
 
         return self._llm_providers[cache_key]
 
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the model's long-lived event loop, starting it on first use."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="arcane-llm-loop", daemon=True)
+            self._loop_thread.start()
+        return self._loop
+
+    def close(self) -> None:
+        """Close provider clients, stop the event loop and finalize the run log.
+
+        Waits for a step in progress to finish first. Safe to call twice;
+        step() is a no-op afterwards.
+        """
+        with self._step_lock:
+            if self.closed:
+                return
+            self.closed = True
+
+            loop = self._loop
+            if loop is not None:
+                # Detach providers first so new complete_sync calls don't queue
+                # work on a loop that is about to stop
+                for provider in self._llm_providers.values():
+                    provider.use_loop(None)
+                # Cancel anything still running outside a step so threads
+                # blocked on it get an error instead of waiting forever
+                asyncio.run_coroutine_threadsafe(_cancel_pending_tasks(), loop).result()
+            for provider in self._llm_providers.values():
+                try:
+                    if loop is not None:
+                        asyncio.run_coroutine_threadsafe(provider.aclose(), loop).result()
+                    else:
+                        asyncio.run(provider.aclose())
+                except Exception as e:
+                    logger.warning(f"Closing {provider!r} failed: {e}")
+            if loop is not None:
+                loop.call_soon_threadsafe(loop.stop)
+                self._loop_thread.join()
+                loop.close()
+                self._loop = self._loop_thread = None
+            # Cached replies belong to this run; a relaunch starts fresh
+            clear_completion_cache()
+            self.event_logger.close()
+
     def _load_default_config(self) -> dict:
         """Load default config from settings.yaml if available."""
-        config_path = os.path.join(
-            os.path.dirname(__file__), "config", "settings.yaml"
-        )
-        if os.path.exists(config_path):
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        return {}
+        try:
+            return load_yaml_cached(_DEFAULT_CONFIG_PATH)
+        except OSError:
+            return {}
+
+
+def _get_provider_class(provider_name: str) -> type[BaseProvider]:
+    """Resolve a provider name to its class, importing the module on first use.
+
+    Unknown names fall back to Gemini.
+    """
+    cls = _PROVIDER_CLASSES.get(provider_name)
+    if cls is None:
+        module_name, class_name = _PROVIDER_MODULES.get(
+            provider_name, _PROVIDER_MODULES["gemini"])
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _PROVIDER_CLASSES[provider_name] = cls
+    return cls
@@ -9,14 +9,29 @@ All events are written to both the console (for the active logs panel in SolaraV
 and to a JSON log file for post-simulation analysis.
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
+import sys
+import threading
+from collections import deque
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Optional
 from enum import Enum
 
+# JSONL write batching: the writer thread flushes after this many events or
+# after this many ms without a full batch, whichever comes first
+LOG_BATCH_SIZE = int(os.getenv("ARCANE_LOG_BATCH_SIZE", "64"))
+LOG_BATCH_MS = float(os.getenv("ARCANE_LOG_BATCH_MS", "250"))
+
+# Optional JSONL compression: "gzip", "zstd", or "1" for zstd when the
+# zstandard package is installed (gzip otherwise). Off by default.
+LOG_COMPRESS = os.getenv("ARCANE_LOG_COMPRESS", "").strip().lower()
+
 
 class EventType(str, Enum):
     """Types of events that can be logged."""
@@ -45,7 +60,15 @@ class EventType(str, Enum):
     SIMULATION_END = "simulation_end"
 
 
-@dataclass
+# Hot-path lookups: EventType.X and .value both go through Python-level enum
+# descriptors, so per-event code uses these module-level bindings instead
+_TYPE_VALUE = {t: t.value for t in EventType}
+_TYPE_TAG = {t: f"[{t.value.upper()}]" for t in EventType}
+_MESSAGE_SENT = EventType.MESSAGE_SENT
+_TACTIC_USED = EventType.TACTIC_USED
+
+
+@dataclass(slots=True)
 class SimEvent:
     """A structured simulation event."""
     step: int
@@ -57,34 +80,101 @@ class SimEvent:
     location: Optional[str] = None
     content: Optional[str] = None
     metadata: dict = field(default_factory=dict)
+    # Serialized JSON line, filled in on first as_json() call
+    _json: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        # IDs and channels come from a small vocabulary; share one str per value
+        if self.agent_id is not None:
+            self.agent_id = sys.intern(self.agent_id)
+        if self.target_id is not None:
+            self.target_id = sys.intern(self.target_id)
+        if self.channel is not None:
+            self.channel = sys.intern(self.channel)
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d["event_type"] = self.event_type.value
-        return d
+        return {
+            "step": self.step,
+            "event_type": _TYPE_VALUE[self.event_type],
+            "timestamp": self.timestamp,
+            "agent_id": self.agent_id,
+            "target_id": self.target_id,
+            "channel": self.channel,
+            "location": self.location,
+            "content": self.content,
+            "metadata": self.metadata,
+        }
+
+    def as_json(self) -> str:
+        """Compact JSON for the log file (None fields omitted), built once."""
+        if self._json is None:
+            d = {"step": self.step, "event_type": _TYPE_VALUE[self.event_type],
+                 "timestamp": self.timestamp}
+            if self.agent_id is not None:
+                d["agent_id"] = self.agent_id
+            if self.target_id is not None:
+                d["target_id"] = self.target_id
+            if self.channel is not None:
+                d["channel"] = self.channel
+            if self.location is not None:
+                d["location"] = self.location
+            if self.content is not None:
+                d["content"] = self.content
+            if self.metadata:
+                d["metadata"] = self.metadata
+            self._json = json.dumps(d, ensure_ascii=False)
+        return self._json
 
     def to_log_string(self) -> str:
         """Format for the active logs panel."""
-        parts = [f"[Step {self.step}]", f"[{self.event_type.value.upper()}]"]
-
-        if self.agent_id:
-            parts.append(f"{self.agent_id}")
-
-        if self.target_id:
-            parts.append(f"→ {self.target_id}")
-
-        if self.channel:
-            parts.append(f"via {self.channel}")
-
-        if self.location:
-            parts.append(f"@ {self.location}")
-
-        if self.content:
+        content = self.content
+        if content and len(content) > 120:
             # Truncate long content for display
-            display_content = self.content[:120] + "..." if len(self.content) > 120 else self.content
-            parts.append(f": {display_content}")
-
-        return " ".join(parts)
+            content = content[:120] + "..."
+        return (
+            f"[Step {self.step}] {_TYPE_TAG[self.event_type]}"
+            f"{' ' + self.agent_id if self.agent_id else ''}"
+            f"{' → ' + self.target_id if self.target_id else ''}"
+            f"{' via ' + self.channel if self.channel else ''}"
+            f"{' @ ' + self.location if self.location else ''}"
+            f"{' : ' + content if content else ''}"
+        )
+
+
+@dataclass(slots=True)
+class PairStats:
+    """Running totals for events one agent directed at another."""
+    messages: int = 0
+    channels: dict = field(default_factory=dict)  # channel -> None, in first-use order
+    tactics: list = field(default_factory=list)   # {"tactic", "phase", "step"} dicts
+
+
+def _log_codec(setting: str) -> str:
+    """Resolve an ARCANE_LOG_COMPRESS value to "zstd", "gzip" or ""."""
+    if setting in ("", "0", "false", "no", "off"):
+        return ""
+    if setting == "gzip":
+        return "gzip"
+    try:
+        import zstandard  # noqa: F401
+        return "zstd"
+    except ImportError:
+        return "gzip"
+
+
+def _batch_compressor(codec: str):
+    """Return a function compressing one batch into a self-contained gzip
+    member / zstd frame.
+
+    Concatenated members and frames decode as one stream, and since each
+    batch is complete on its own, a log that is still being written can
+    be read back up to its last flushed batch.
+    """
+    if codec == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=1).compress
+    import gzip
+    return lambda buf: gzip.compress(buf, compresslevel=1)
 
 
 class EventLogger:
@@ -100,7 +190,7 @@ class EventLogger:
         self.max_buffer_size = max_buffer_size
 
         # In-memory buffer for the active logs panel
-        self.event_buffer: list[SimEvent] = []
+        self.event_buffer: deque[SimEvent] = deque(maxlen=max_buffer_size)
 
         # All events for the current run
         self.all_events: list[SimEvent] = []
@@ -108,10 +198,23 @@ class EventLogger:
         # Step-indexed events for quick lookup
         self.step_events: dict[int, list[SimEvent]] = {}
 
+        # Event counts per (step, event_type)
+        self.step_type_counts: dict[tuple[int, EventType], int] = {}
+
+        # Type- and agent-indexed events, maintained as events are logged
+        self.events_by_type: dict[EventType, list[SimEvent]] = {}
+        self.events_by_agent: dict[str, list[SimEvent]] = {}
+
+        # Message and tactic aggregates per (agent_id, target_id)
+        self.pair_stats: dict[tuple[str, str], PairStats] = {}
+
         # Set up file logging
         os.makedirs(log_dir, exist_ok=True)
         self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file_path = os.path.join(log_dir, f"run_{self.run_id}.jsonl")
+        codec = _log_codec(LOG_COMPRESS)
+        if codec:
+            self.log_file_path += ".zst" if codec == "zstd" else ".gz"
 
         # Python logger for console output
         self.logger = logging.getLogger("root.events")
@@ -123,8 +226,31 @@ class EventLogger:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
 
+        # Events are serialized and written by a background thread so the
+        # simulation step never waits on json.dumps or disk I/O. Each batch is
+        # encoded once (and compressed, if enabled) and written to the raw fd,
+        # bypassing TextIOWrapper.
+        self._compress = _batch_compressor(codec) if codec else None
+        self._fd = os.open(
+            self.log_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._closed = False
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop,
+                                        name=f"event-writer-{self.run_id}",
+                                        daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
     def log(self, event: SimEvent) -> None:
-        """Log a simulation event."""
+        """Log a simulation event.
+
+        Raises:
+            RuntimeError: if the logger has been closed (the event could no
+                longer reach the run log)
+        """
+        if self._closed:
+            raise RuntimeError(f"EventLogger for run_{self.run_id} is closed")
+
         # Add to buffers
         self.all_events.append(event)
         self.event_buffer.append(event)
@@ -133,17 +259,142 @@ class EventLogger:
         if event.step not in self.step_events:
             self.step_events[event.step] = []
         self.step_events[event.step].append(event)
+        key = (event.step, event.event_type)
+        self.step_type_counts[key] = self.step_type_counts.get(key, 0) + 1
+
+        # Index by type and by involved agent
+        self.events_by_type.setdefault(event.event_type, []).append(event)
+        if event.agent_id:
+            self.events_by_agent.setdefault(event.agent_id, []).append(event)
+        if event.target_id and event.target_id != event.agent_id:
+            self.events_by_agent.setdefault(event.target_id, []).append(event)
+
+        # Per-pair aggregates for the live analyzer
+        etype = event.event_type
+        if etype is _MESSAGE_SENT or etype is _TACTIC_USED:
+            pair = (event.agent_id, event.target_id)
+            stats = self.pair_stats.get(pair)
+            if stats is None:
+                stats = self.pair_stats[pair] = PairStats()
+            if etype is _MESSAGE_SENT:
+                stats.messages += 1
+                if event.channel:
+                    stats.channels[event.channel] = None
+            else:
+                stats.tactics.append({
+                    "tactic": event.metadata.get("tactic", "unknown"),
+                    "phase": event.metadata.get("phase", 0),
+                    "step": event.step,
+                })
+
+        # Console output: format the line once here rather than once per
+        # handler, without keeping it on the event; skipped when INFO is off
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(event.to_log_string())
+
+        # Hand off to the writer thread
+        self._queue.put(event)
+
+    def _writer_loop(self) -> None:
+        """Drain queued events into the JSONL file in batches.
+
+        Besides events, the queue carries threading.Event markers (set once
+        everything queued before them is on disk) and a None shutdown sentinel.
+        """
+        timeout = LOG_BATCH_MS / 1000
+        get = self._queue.get
+        while True:
+            try:
+                item = get(timeout=timeout)
+            except queue.Empty:
+                continue
 
-        # Trim buffer if too large
-        if len(self.event_buffer) > self.max_buffer_size:
-            self.event_buffer = self.event_buffer[-self.max_buffer_size:]
-
-        # Console output
-        self.logger.info(event.to_log_string())
-
-        # Write to file
-        with open(self.log_file_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+            lines: list[str] = []
+            markers: list[threading.Event] = []
+            stop = False
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    try:
+                        lines.append(item.as_json() + "\n")
+                    except (TypeError, ValueError) as e:
+                        # One bad metadata value must not stop the writer
+                        self.logger.error(f"Run log skipped an unserializable "
+                                          f"{_TYPE_VALUE[item.event_type]} event: {e}")
+                if len(lines) >= LOG_BATCH_SIZE:
+                    break
+                try:
+                    item = get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+            try:
+                if lines:
+                    buf = "".join(lines).encode("utf-8")
+                    if self._compress is not None:
+                        buf = self._compress(buf)
+                    self._write_all(buf)
+            except Exception as e:
+                # Keep draining: a dead writer would leave the queue growing
+                # and flush() waiting forever
+                self.logger.error(f"Run log write failed, {len(lines)} events "
+                                  f"lost: {e}")
+            finally:
+                for marker in markers:
+                    marker.set()
+            if stop:
+                return
+
+    def _write_all(self, buf: bytes) -> None:
+        """os.write the whole buffer, retrying on short writes."""
+        view = memoryview(buf)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def flush(self) -> None:
+        """Block until every event logged so far has been written to the file."""
+        marker = threading.Event()
+        self._queue.put(marker)
+        # Poll so a writer that died anyway can't block the caller forever
+        while not marker.wait(0.5):
+            if not self._writer.is_alive():
+                return
+
+    def close(self) -> None:
+        """Drain pending events, stop the writer and close the file. Safe to call twice.
+
+        Also writes a run_<id>.meta.json sidecar so list_runs can skip
+        re-scanning the finished log.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        os.fsync(self._fd)
+        os.close(self._fd)
+        atexit.unregister(self.close)
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        """Write the finished run's list_runs summary next to the log."""
+        step_events = (self.events_by_type.get(EventType.STEP_START, [])
+                       + self.events_by_type.get(EventType.STEP_END, []))
+        meta = {
+            "run_id": f"run_{self.run_id}",
+            "steps": max((e.step for e in step_events), default=0),
+            "reveals": self.count_by_type(EventType.INFORMATION_REVEALED),
+            "log_file": os.path.basename(self.log_file_path),
+        }
+        meta_path = os.path.join(self.log_dir, f"run_{self.run_id}.meta.json")
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
 
     def log_step_start(self, step: int, sim_time: str) -> None:
         """Convenience: log the start of a simulation step."""
@@ -217,7 +468,8 @@ class EventLogger:
 
     def get_recent_events(self, n: int = 50) -> list[SimEvent]:
         """Get the N most recent events (for the live panel)."""
-        return self.event_buffer[-n:]
+        buf = self.event_buffer
+        return list(islice(buf, max(len(buf) - n, 0), None))
 
     def get_step_events(self, step: int) -> list[SimEvent]:
         """Get all events for a specific step."""
@@ -225,12 +477,28 @@ class EventLogger:
 
     def get_events_by_type(self, event_type: EventType) -> list[SimEvent]:
         """Get all events of a specific type."""
-        return [e for e in self.all_events if e.event_type == event_type]
+        return list(self.events_by_type.get(event_type, ()))
+
+    def count_by_type(self, event_type: EventType) -> int:
+        """Number of events of a specific type logged so far."""
+        return len(self.events_by_type.get(event_type, ()))
+
+    def count_for_step(self, step: int, event_type: EventType) -> int:
+        """Number of events of a specific type logged during a step."""
+        return self.step_type_counts.get((step, event_type), 0)
+
+    def count_messages(self, sender_id: str, recipient_id: str) -> int:
+        """Number of messages sent from one agent to another."""
+        stats = self.pair_stats.get((sender_id, recipient_id))
+        return stats.messages if stats else 0
+
+    def get_pair_stats(self, agent_id: str, target_id: str) -> PairStats | None:
+        """Message/tactic aggregates for events agent_id directed at target_id."""
+        return self.pair_stats.get((agent_id, target_id))
 
     def get_events_by_agent(self, agent_id: str) -> list[SimEvent]:
         """Get all events involving a specific agent."""
-        return [e for e in self.all_events
-                if e.agent_id == agent_id or e.target_id == agent_id]
+        return list(self.events_by_agent.get(agent_id, ()))
 
     def get_conversation_between(self, agent1_id: str, agent2_id: str) -> list[SimEvent]:
         """Get all message events between two specific agents, chronologically.
@@ -240,8 +508,8 @@ class EventLogger:
         """
         pair = {agent1_id, agent2_id}
         return [
-            e for e in self.all_events
-            if e.event_type == EventType.MESSAGE_SENT
+            e for e in self.events_by_agent.get(agent1_id, ())
+            if e.event_type is _MESSAGE_SENT
             and {e.agent_id, e.target_id} == pair
         ]
 
@@ -251,9 +519,7 @@ class EventLogger:
         Returns list of dicts: {agents: [a, b], message_count: N, last_step: S}
         """
         pair_counts: dict[tuple, dict] = {}
-        for e in self.all_events:
-            if e.event_type != EventType.MESSAGE_SENT:
-                continue
+        for e in self.events_by_type.get(EventType.MESSAGE_SENT, ()):
             if not e.agent_id or not e.target_id:
                 continue
             pair = tuple(sorted([e.agent_id, e.target_id]))
@@ -275,16 +541,19 @@ class EventLogger:
         """Export all events to a JSON file."""
         path = filepath or os.path.join(self.log_dir, f"run_{self.run_id}_full.json")
         with open(path, "w", encoding="utf-8") as f:
-            json.dump([e.to_dict() for e in self.all_events], f,
-                      indent=2, ensure_ascii=False)
+            # Stream the cached per-event JSON rather than building one big string
+            f.write("[")
+            sep = ""
+            for e in self.all_events:
+                f.write(sep)
+                f.write(e.as_json())
+                sep = ",\n"
+            f.write("]")
         return path
 
     def get_summary(self) -> dict:
         """Get a summary of logged events."""
-        type_counts = {}
-        for e in self.all_events:
-            t = e.event_type.value
-            type_counts[t] = type_counts.get(t, 0) + 1
+        type_counts = {t.value: len(evts) for t, evts in self.events_by_type.items()}
         return {
             "run_id": self.run_id,
             "total_events": len(self.all_events),
@@ -5,17 +5,33 @@ Processes simulation event logs (live or from file) into structured
 attack progress reports. Used by both the CLI and the API/dashboard.
 """
 
+import gzip
+import io
 import json
 import os
+from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    from json import loads as _json_loads
+
+# Raised when a compressed log ends mid-member / mid-frame (run still being
+# written, or cut off by a crash)
+try:
+    from zstandard import ZstdError
+    _TRUNCATED_LOG_ERRORS: tuple[type[Exception], ...] = (EOFError, ZstdError)
+except ImportError:  # zstandard is optional; .zst logs can't be opened without it
+    _TRUNCATED_LOG_ERRORS = (EOFError,)
+
 if TYPE_CHECKING:
     from backend.model import ArcaneModel
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetResult:
     """Results for a single attack target."""
     target_id: str
@@ -30,7 +46,7 @@ class TargetResult:
     trust_level: float = 0.2
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviantResult:
     """Results for a single deviant agent."""
     deviant_id: str = ""
@@ -38,7 +54,7 @@ class DeviantResult:
     targets: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResults:
     """Full results for a simulation run."""
     run_id: str = ""
@@ -54,6 +70,37 @@ class RunResults:
     attack_success: bool = False
 
 
+def _open_log(path: Path):
+    """Open a run log for binary line iteration, decompressing .gz / .zst."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    if path.suffix == ".zst":
+        import zstandard
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(
+            open(path, "rb"), read_across_frames=True, closefd=True))
+    return open(path, "rb")
+
+
+def _iter_log_lines(path: Path):
+    """Yield the non-blank lines of a run log.
+
+    A truncated trailing member / frame ends the iteration instead of
+    raising, so the readable part of a live or crashed run is returned.
+    """
+    with _open_log(path) as f:
+        try:
+            for line in f:
+                if not line.isspace():
+                    yield line
+        except _TRUNCATED_LOG_ERRORS:
+            return
+
+
+def _run_stem(path: Path) -> str:
+    """File name without .jsonl / .jsonl.gz / .jsonl.zst, e.g. "run_20260217_143022"."""
+    return path.name.split(".", 1)[0]
+
+
 # Phase names for display
 _PHASE_NAMES = {
     1: "establish_contact",
@@ -64,7 +111,7 @@ _PHASE_NAMES = {
 }
 
 
-def _build_targets_for_deviant(deviant, events, model, EventType) -> list:
+def _build_targets_for_deviant(deviant, event_logger, model) -> list:
     """Build per-target results for a single deviant agent."""
     # Start with objective targets, but filter out IDs that don't exist in the model
     target_ids = [
@@ -82,33 +129,9 @@ def _build_targets_for_deviant(deviant, events, model, EventType) -> list:
         target_agent = model.agents_by_id.get(target_id)
         target_name = getattr(target_agent, 'name', target_id) if target_agent else target_id
 
-        # Messages sent by deviant to this target
-        msgs_sent = sum(
-            1 for e in events
-            if e.event_type == EventType.MESSAGE_SENT
-            and e.agent_id == deviant.agent_id
-            and e.target_id == target_id
-        )
-
-        # Messages received from this target
-        msgs_received = sum(
-            1 for e in events
-            if e.event_type == EventType.MESSAGE_SENT
-            and e.agent_id == target_id
-            and e.target_id == deviant.agent_id
-        )
-
-        # Tactics used against this target
-        tactics = []
-        for e in events:
-            if (e.event_type == EventType.TACTIC_USED
-                    and e.agent_id == deviant.agent_id
-                    and e.target_id == target_id):
-                tactics.append({
-                    "tactic": e.metadata.get("tactic", "unknown"),
-                    "phase": e.metadata.get("phase", 0),
-                    "step": e.step,
-                })
+        # Messages, tactics and channels from the logger's running aggregates
+        stats = event_logger.get_pair_stats(deviant.agent_id, target_id)
+        msgs_received = event_logger.count_messages(target_id, deviant.agent_id)
 
         # Info extracted from this target
         info_extracted = []
@@ -116,33 +139,26 @@ def _build_targets_for_deviant(deviant, events, model, EventType) -> list:
         for item in state.get("info_extracted", []):
             info_extracted.append(item)
 
-        # Also check benign agent's revealed_info
+        # Also check benign agent's revealed_info, skipping (type, step, channel)
+        # duplicates of what the deviant already recorded
         if target_agent and hasattr(target_agent, 'revealed_info'):
+            seen = {(i.get("info_type"), i.get("step"), i.get("channel"))
+                    for i in info_extracted}
             for item in target_agent.revealed_info:
-                if item.get("revealed_to") == deviant.agent_id:
-                    entry = {
-                        "info_type": item.get("info_type", "unknown"),
-                        "sensitivity": item.get("sensitivity", "medium"),
-                        "channel": item.get("channel", "unknown"),
-                        "step": item.get("step", 0),
-                        "value": item.get("value", ""),
-                    }
-                    if not any(
-                        e.get("info_type") == entry["info_type"]
-                        and e.get("step") == entry["step"]
-                        and e.get("channel") == entry["channel"]
-                        for e in info_extracted
-                    ):
-                        info_extracted.append(entry)
-
-        # Channels used
-        channels = list(set(
-            e.channel for e in events
-            if e.event_type == EventType.MESSAGE_SENT
-            and e.agent_id == deviant.agent_id
-            and e.target_id == target_id
-            and e.channel
-        ))
+                if item.get("revealed_to") != deviant.agent_id:
+                    continue
+                key = (item.get("info_type", "unknown"), item.get("step", 0),
+                       item.get("channel", "unknown"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                info_extracted.append({
+                    "info_type": key[0],
+                    "sensitivity": item.get("sensitivity", "medium"),
+                    "channel": key[2],
+                    "step": key[1],
+                    "value": item.get("value", ""),
+                })
 
         # Current phase and trust
         current_phase = state.get("phase", 1)
@@ -153,11 +169,11 @@ def _build_targets_for_deviant(deviant, events, model, EventType) -> list:
         targets.append(TargetResult(
             target_id=target_id,
             target_name=target_name,
-            messages_sent=msgs_sent,
+            messages_sent=stats.messages if stats else 0,
             messages_received=msgs_received,
-            tactics_used=tactics,
+            tactics_used=list(stats.tactics) if stats else [],
             info_extracted=info_extracted,
-            channels_used=channels,
+            channels_used=list(stats.channels) if stats else [],
             current_phase=current_phase,
             phase_name=_PHASE_NAMES.get(current_phase, "unknown"),
             trust_level=trust_level,
@@ -173,7 +189,7 @@ def analyze_live(model: "ArcaneModel") -> RunResults:
     """
     from backend.research.event_logger import EventType
 
-    events = model.event_logger.all_events
+    event_logger = model.event_logger
 
     # Find ALL deviant agents
     deviant_agents = [
@@ -183,22 +199,22 @@ def analyze_live(model: "ArcaneModel") -> RunResults:
 
     if not deviant_agents:
         return RunResults(
-            run_id=model.event_logger.run_id,
+            run_id=event_logger.run_id,
             total_steps=model.step_count,
             sim_time=model.sim_time_str,
         )
 
     # Count totals from events
-    total_messages = sum(1 for e in events if e.event_type == EventType.MESSAGE_SENT)
-    total_reveals = sum(1 for e in events if e.event_type == EventType.INFORMATION_REVEALED)
-    total_tactics = sum(1 for e in events if e.event_type == EventType.TACTIC_USED)
+    total_messages = event_logger.count_by_type(EventType.MESSAGE_SENT)
+    total_reveals = event_logger.count_by_type(EventType.INFORMATION_REVEALED)
+    total_tactics = event_logger.count_by_type(EventType.TACTIC_USED)
 
     # Build per-deviant results
     deviant_results = []
     all_targets = []
 
     for deviant in deviant_agents:
-        targets = _build_targets_for_deviant(deviant, events, model, EventType)
+        targets = _build_targets_for_deviant(deviant, event_logger, model)
         deviant_results.append(DeviantResult(
             deviant_id=deviant.agent_id,
             deviant_name=deviant.name,
@@ -217,7 +233,7 @@ def analyze_live(model: "ArcaneModel") -> RunResults:
     primary = deviant_agents[0]
 
     return RunResults(
-        run_id=model.event_logger.run_id,
+        run_id=event_logger.run_id,
         total_steps=model.step_count,
         sim_time=model.sim_time_str,
         deviant_id=primary.agent_id,
@@ -237,145 +253,101 @@ def analyze_file(log_path: str) -> RunResults:
     if not path.exists():
         raise FileNotFoundError(f"Log file not found: {log_path}")
 
-    events = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                events.append(json.loads(line))
-
-    if not events:
-        run_id = path.stem.replace("run_", "")
-        return RunResults(run_id=run_id)
-
-    # Extract run_id from filename
-    run_id = path.stem  # e.g. "run_20260217_143022"
-
-    # Find deviant agent ID from tactic events
-    deviant_id = ""
-    deviant_name = ""
-    for e in events:
-        if e.get("event_type") == "tactic_used" and e.get("agent_id"):
-            deviant_id = e["agent_id"]
-            break
-
-    # If no tactic events, try to find deviant from message patterns
-    if not deviant_id:
-        # Look for the agent that sends the most messages
-        sender_counts: dict[str, int] = {}
-        for e in events:
-            if e.get("event_type") == "message_sent" and e.get("agent_id"):
-                sid = e["agent_id"]
-                sender_counts[sid] = sender_counts.get(sid, 0) + 1
-        if sender_counts:
-            deviant_id = max(sender_counts, key=sender_counts.get)
-
-    # Count totals
-    total_messages = sum(1 for e in events if e.get("event_type") == "message_sent")
-    total_reveals = sum(1 for e in events if e.get("event_type") == "information_revealed")
-    total_tactics = sum(1 for e in events if e.get("event_type") == "tactic_used")
-
-    # Find total steps and sim time from step events
+    # Single pass while reading: totals plus per-(agent, target) accumulators.
+    # The deviant is only known afterwards, so pairs are kept for every agent.
+    n_events = 0
+    total_messages = total_reveals = total_tactics = 0
     total_steps = 0
     sim_time = ""
-    for e in reversed(events):
-        if e.get("event_type") in ("step_start", "step_end"):
+    first_tactic_agent = ""
+    sender_counts: dict[str, int] = defaultdict(int)
+    msg_counts: dict[tuple, int] = defaultdict(int)
+    channels_by_pair: dict[tuple, dict] = defaultdict(dict)
+    tactics_by_pair: dict[tuple, list] = defaultdict(list)
+    reveals_by_pair: dict[tuple, list] = defaultdict(list)
+    phase_by_pair: dict[tuple, int] = {}
+    trust_by_pair: dict[tuple, float] = {}
+    targets_by_agent: dict[str, dict] = defaultdict(dict)  # agent -> ordered target ids
+
+    for line in _iter_log_lines(path):
+        n_events += 1
+        e = _json_loads(line)
+        etype = e.get("event_type")
+        agent_id = e.get("agent_id")
+        target_id = e.get("target_id")
+        pair = (agent_id, target_id)
+
+        if etype == "message_sent":
+            total_messages += 1
+            msg_counts[pair] += 1
+            if agent_id:
+                sender_counts[agent_id] += 1
+                if target_id:
+                    targets_by_agent[agent_id][target_id] = None
+            if e.get("channel"):
+                channels_by_pair[pair][e["channel"]] = None
+        elif etype == "tactic_used":
+            total_tactics += 1
+            if agent_id:
+                if not first_tactic_agent:
+                    first_tactic_agent = agent_id
+                if target_id:
+                    targets_by_agent[agent_id][target_id] = None
+            meta = e.get("metadata", {})
+            tactics_by_pair[pair].append({
+                "tactic": meta.get("tactic", "unknown"),
+                "phase": meta.get("phase", 0),
+                "step": e.get("step", 0),
+            })
+        elif etype == "information_revealed":
+            total_reveals += 1
+            meta = e.get("metadata", {})
+            reveals_by_pair[pair].append({
+                "info_type": meta.get("info_type", "unknown"),
+                "sensitivity": meta.get("sensitivity", "medium"),
+                "channel": e.get("channel", "unknown"),
+                "step": e.get("step", 0),
+                "value": meta.get("value", ""),
+            })
+        elif etype == "goal_phase_change":
+            meta = e.get("metadata", {})
+            phase_by_pair[pair] = max(phase_by_pair.get(pair, 1), meta.get("to_phase", 1))
+        elif etype == "trust_change":
+            meta = e.get("metadata", {})
+            trust_by_pair[pair] = meta.get("new_trust", trust_by_pair.get(pair, 0.2))
+        elif etype in ("step_start", "step_end"):
             total_steps = max(total_steps, e.get("step", 0))
-            if not sim_time:
-                sim_time = e.get("timestamp", "")
-
-    # Build per-target results
-    target_ids = set()
-    for e in events:
-        if e.get("event_type") == "message_sent" and e.get("agent_id") == deviant_id:
-            if e.get("target_id"):
-                target_ids.add(e["target_id"])
-        if e.get("event_type") == "tactic_used" and e.get("agent_id") == deviant_id:
-            if e.get("target_id"):
-                target_ids.add(e["target_id"])
+            sim_time = e.get("timestamp", "")
 
-    targets = []
-    for target_id in target_ids:
-        # Messages
-        msgs_sent = sum(
-            1 for e in events
-            if e.get("event_type") == "message_sent"
-            and e.get("agent_id") == deviant_id
-            and e.get("target_id") == target_id
-        )
-        msgs_received = sum(
-            1 for e in events
-            if e.get("event_type") == "message_sent"
-            and e.get("agent_id") == target_id
-            and e.get("target_id") == deviant_id
-        )
-
-        # Tactics
-        tactics = []
-        for e in events:
-            if (e.get("event_type") == "tactic_used"
-                    and e.get("agent_id") == deviant_id
-                    and e.get("target_id") == target_id):
-                meta = e.get("metadata", {})
-                tactics.append({
-                    "tactic": meta.get("tactic", "unknown"),
-                    "phase": meta.get("phase", 0),
-                    "step": e.get("step", 0),
-                })
-
-        # Info reveals
-        info_extracted = []
-        for e in events:
-            if (e.get("event_type") == "information_revealed"
-                    and e.get("agent_id") == target_id
-                    and e.get("target_id") == deviant_id):
-                meta = e.get("metadata", {})
-                info_extracted.append({
-                    "info_type": meta.get("info_type", "unknown"),
-                    "sensitivity": meta.get("sensitivity", "medium"),
-                    "channel": e.get("channel", "unknown"),
-                    "step": e.get("step", 0),
-                    "value": meta.get("value", ""),
-                })
+    if not n_events:
+        run_id = _run_stem(path).replace("run_", "")
+        return RunResults(run_id=run_id)
 
-        # Channels
-        channels = list(set(
-            e.get("channel") for e in events
-            if e.get("event_type") == "message_sent"
-            and e.get("agent_id") == deviant_id
-            and e.get("target_id") == target_id
-            and e.get("channel")
-        ))
+    # Extract run_id from filename
+    run_id = _run_stem(path)  # e.g. "run_20260217_143022"
 
-        # Get last phase from goal_phase_change events
-        current_phase = 1
-        for e in events:
-            if (e.get("event_type") == "goal_phase_change"
-                    and e.get("agent_id") == deviant_id
-                    and e.get("target_id") == target_id):
-                meta = e.get("metadata", {})
-                current_phase = max(current_phase, meta.get("to_phase", 1))
+    # Deviant: first agent to use a tactic, else the most active sender
+    deviant_id = first_tactic_agent
+    if not deviant_id and sender_counts:
+        deviant_id = max(sender_counts, key=sender_counts.get)
 
-        # Get last trust level from trust_change events
-        trust_level = 0.2
-        for e in events:
-            if (e.get("event_type") == "trust_change"
-                    and e.get("agent_id") == target_id
-                    and e.get("target_id") == deviant_id):
-                meta = e.get("metadata", {})
-                trust_level = meta.get("new_trust", trust_level)
+    targets = []
+    for target_id in targets_by_agent.get(deviant_id, ()):
+        sent_pair = (deviant_id, target_id)
+        recv_pair = (target_id, deviant_id)
+        current_phase = phase_by_pair.get(sent_pair, 1)
 
         targets.append(TargetResult(
             target_id=target_id,
             target_name=target_id,  # No agent name available from logs
-            messages_sent=msgs_sent,
-            messages_received=msgs_received,
-            tactics_used=tactics,
-            info_extracted=info_extracted,
-            channels_used=channels,
+            messages_sent=msg_counts.get(sent_pair, 0),
+            messages_received=msg_counts.get(recv_pair, 0),
+            tactics_used=tactics_by_pair.get(sent_pair, []),
+            info_extracted=reveals_by_pair.get(recv_pair, []),
+            channels_used=list(channels_by_pair.get(sent_pair, ())),
             current_phase=current_phase,
             phase_name=_PHASE_NAMES.get(current_phase, "unknown"),
-            trust_level=trust_level,
+            trust_level=trust_by_pair.get(recv_pair, 0.2),
         ))
 
     attack_success = any(
@@ -398,6 +370,34 @@ def analyze_file(log_path: str) -> RunResults:
     )
 
 
+def _read_run_meta(log_file: Path, run_id: str) -> dict | None:
+    """Load the run's .meta.json sidecar if it is at least as new as the log."""
+    meta_path = log_file.with_name(f"{run_id}.meta.json")
+    try:
+        if meta_path.stat().st_mtime < log_file.stat().st_mtime:
+            return None
+        return _json_loads(meta_path.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _scan_run_counts(log_file: Path) -> tuple[int, int]:
+    """Count steps and information reveals by scanning a run log."""
+    step_count = 0
+    reveal_count = 0
+    try:
+        for line in _iter_log_lines(log_file):
+            evt = _json_loads(line)
+            etype = evt.get("event_type")
+            if etype in ("step_start", "step_end"):
+                step_count = max(step_count, evt.get("step", 0))
+            elif etype == "information_revealed":
+                reveal_count += 1
+    except (json.JSONDecodeError, IOError, EOFError):
+        pass
+    return step_count, reveal_count
+
+
 def list_runs(log_dir: str = "storage/logs") -> list[dict]:
     """List all simulation run log files with metadata."""
     log_path = Path(log_dir)
@@ -405,9 +405,9 @@ def list_runs(log_dir: str = "storage/logs") -> list[dict]:
         return []
 
     runs = []
-    for f in sorted(log_path.glob("run_*.jsonl"), reverse=True):
+    for f in sorted(log_path.glob("run_*.jsonl*"), reverse=True):
         # Parse run ID and timestamp from filename
-        run_id = f.stem  # e.g. "run_20260217_143022"
+        run_id = _run_stem(f)  # e.g. "run_20260217_143022"
         parts = run_id.replace("run_", "").split("_")
         if len(parts) >= 2:
             date_str = parts[0]
@@ -419,22 +419,14 @@ def list_runs(log_dir: str = "storage/logs") -> list[dict]:
         else:
             display_date = "unknown"
 
-        # Count steps and reveals by scanning the file
-        step_count = 0
-        reveal_count = 0
-        try:
-            with open(f, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    evt = json.loads(line)
-                    if evt.get("event_type") in ("step_start", "step_end"):
-                        step_count = max(step_count, evt.get("step", 0))
-                    if evt.get("event_type") == "information_revealed":
-                        reveal_count += 1
-        except (json.JSONDecodeError, IOError):
-            pass
+        # Steps and reveals: from the sidecar written when the run closed,
+        # otherwise by scanning the file (run still open, or older logs)
+        meta = _read_run_meta(f, run_id)
+        if meta is not None:
+            step_count = meta.get("steps", 0)
+            reveal_count = meta.get("reveals", 0)
+        else:
+            step_count, reveal_count = _scan_run_counts(f)
 
         runs.append({
             "run_id": run_id,
@@ -7,6 +7,7 @@ step execution — that's done from the terminal CLI (run.py).
 """
 
 import os
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -102,22 +103,24 @@ def create_app() -> FastAPI:
         if _model is None:
             return {"error": "Model not initialized", "step": 0, "agents": {}}
 
-        agents_data = {}
-        for agent_id, agent in _model.agents_by_id.items():
-            pos = getattr(agent, 'current_tile', (0, 0))
-            agents_data[agent_id] = {
-                "name": getattr(agent, 'name', 'Unknown'),
-                "type": getattr(agent, 'agent_type', 'benign'),
-                "pos": list(pos) if pos else [0, 0],
+        snap = _model.snapshot
+        agents_data = {
+            agent_id: {
+                "name": name,
+                "type": agent_type,
+                "pos": pos,
                 "sprite": _sprite_assignments.get(agent_id, "Adam_Smith"),
-                "pronunciatio": getattr(agent, 'pronunciatio', '💬'),
-                "activity": getattr(agent, 'current_activity', 'idle')[:60],
-                "location": getattr(agent, 'current_location_name', ''),
+                "pronunciatio": pronunciatio,
+                "activity": activity,
+                "location": location,
             }
+            for agent_id, name, agent_type, pos, pronunciatio, activity, location
+            in snap.agents
+        }
 
         return {
-            "step": _model.step_count,
-            "sim_time": _model.sim_time_str,
+            "step": snap.step,
+            "sim_time": snap.sim_time,
             "grid": {
                 "width": _model.grid.width,
                 "height": _model.grid.height,
@@ -131,19 +134,15 @@ def create_app() -> FastAPI:
         if _model is None:
             return {"events": []}
 
-        events = _model.event_logger.get_recent_events(n)
+        snap = _model.snapshot
         return {
-            "events": [
-                {
-                    "step": e.step,
-                    "type": e.event_type.value,
-                    "timestamp": e.timestamp,
-                    "agent": e.agent_id or "",
-                    "target": e.target_id or "",
-                    "content": e.content,
-                }
-                for e in events
-            ]
+            # Run-wide totals for the metrics panel (the event window is only the last n)
+            "totals": {
+                "message_sent": snap.msg_count,
+                "information_revealed": snap.reveal_count,
+                "tactic_used": snap.tactic_count,
+            },
+            "events": list(snap.recent[-n:]) if n > 0 else [],
         }
 
     @app.get("/api/agents")
@@ -182,8 +181,11 @@ def create_app() -> FastAPI:
         results = analyze_live(_model)
         return results_to_dict(results)
 
+    # Handlers that read run logs or recordings from disk are plain `def`:
+    # FastAPI runs them in its threadpool, so a large file can't stall the
+    # event loop serving the dashboard's state/event polls
     @app.get("/api/history")
-    async def get_history():
+    def get_history():
         """Return list of past simulation runs."""
         from backend.research.results_analyzer import list_runs
 
@@ -194,7 +196,7 @@ def create_app() -> FastAPI:
         return {"runs": list_runs(log_dir)}
 
     @app.get("/api/history/{run_id}")
-    async def get_historical_results(run_id: str):
+    def get_historical_results(run_id: str):
         """Return results from a past simulation run."""
         from backend.research.results_analyzer import list_runs, analyze_file, results_to_dict
 
@@ -248,10 +250,7 @@ def create_app() -> FastAPI:
             return {"messages": []}
 
         from backend.research.event_logger import EventType
-        events = [
-            e for e in _model.event_logger.all_events
-            if e.event_type == EventType.MESSAGE_SENT
-        ]
+        events = _model.event_logger.get_events_by_type(EventType.MESSAGE_SENT)
 
         messages = []
         for e in events:
@@ -341,13 +340,12 @@ def create_app() -> FastAPI:
     @app.get("/api/setup/providers")
     async def get_setup_providers():
         """Return available LLM providers and current configuration."""
-        import yaml as _yaml
+        from backend.config.yaml_loader import load_yaml
 
         config_path = _BACKEND_DIR / "config" / "settings.yaml"
         config = {}
         if config_path.exists():
-            with open(config_path, encoding='utf-8') as f:
-                config = _yaml.safe_load(f) or {}
+            config = load_yaml(config_path)
 
         llm_cfg = config.get("llm", {})
         local_cfg = config.get("local_llm", {})
@@ -395,13 +393,12 @@ def create_app() -> FastAPI:
         if _model is not None:
             return {"error": "Simulation already running. Restart the server to configure a new one."}
 
-        import yaml as _yaml
+        from backend.config.yaml_loader import load_yaml
 
         # Load base config
         config_path = _BACKEND_DIR / "config" / "settings.yaml"
         if config_path.exists():
-            with open(config_path, encoding='utf-8') as f:
-                config = _yaml.safe_load(f) or {}
+            config = load_yaml(config_path)
         else:
             config = {}
 
@@ -430,31 +427,36 @@ def create_app() -> FastAPI:
         if agent_defs:
             config.setdefault("simulation", {})["agents"] = agent_defs
 
-        # Create model
+        # Build the new model first, so a failed launch leaves the current one in place
         try:
             from backend.model import ArcaneModel
-            _model = ArcaneModel(config=config)
-            _assign_sprites()
-
-            agent_count = len(_model.agents_by_id)
-            deviant_count = sum(1 for a in _model.agents_by_id.values()
-                                if getattr(a, 'agent_type', '') == 'deviant')
-
-            logger.info(f"Simulation launched via setup: {agent_count} agents "
-                        f"({deviant_count} deviant), provider={provider}")
-
-            return {
-                "success": True,
-                "agents": agent_count,
-                "deviant_count": deviant_count,
-                "benign_count": agent_count - deviant_count,
-                "provider": provider,
-                "model": model_name or "default",
-            }
+            new_model = ArcaneModel(config=config)
         except Exception as e:
             logger.error(f"Failed to launch simulation: {e}")
             return {"error": str(e)}
 
+        old_model, _model = _model, new_model
+        _assign_sprites()
+
+        # Retire the previous run (LLM clients, event loop, log); close() waits
+        # for a step in progress, so it runs off the server loop
+        if old_model is not None:
+            await asyncio.to_thread(old_model.close)
+
+        agent_count = len(_model.agents_by_id)
+
+        logger.info(f"Simulation launched via setup: {agent_count} agents "
+                    f"({_model.deviant_count} deviant), provider={provider}")
+
+        return {
+            "success": True,
+            "agents": agent_count,
+            "deviant_count": _model.deviant_count,
+            "benign_count": _model.benign_count,
+            "provider": provider,
+            "model": model_name or "default",
+        }
+
     @app.post("/api/setup/test-connection")
     async def test_llm_connection(body: dict):
         """Test connectivity to a local LLM server."""
@@ -478,7 +480,7 @@ def create_app() -> FastAPI:
     # --- Recording & Replay API endpoints ---
 
     @app.get("/api/recordings")
-    async def get_recordings():
+    def get_recordings():
         """List all available simulation recordings."""
         from backend.research.sim_player import list_recordings
 
@@ -490,7 +492,7 @@ def create_app() -> FastAPI:
         return {"recordings": recordings}
 
     @app.get("/api/recordings/{run_id}")
-    async def get_recording_meta(run_id: str):
+    def get_recording_meta(run_id: str):
         """Get metadata for a specific recording."""
         from backend.research.sim_player import SimPlayer, list_recordings
 
@@ -517,7 +519,7 @@ def create_app() -> FastAPI:
             return {"error": str(e)}
 
     @app.get("/api/recordings/{run_id}/step/{step}")
-    async def get_recording_frame(run_id: str, step: int):
+    def get_recording_frame(run_id: str, step: int):
         """Get state + events frame for a specific step in a recording."""
         from backend.research.sim_player import SimPlayer, list_recordings
 
@@ -554,7 +556,7 @@ def create_app() -> FastAPI:
         }
 
     @app.get("/api/recordings/{run_id}/full")
-    async def get_recording_full(run_id: str):
+    def get_recording_full(run_id: str):
         """Get the entire recording (all frames) for client-side replay."""
         from backend.research.sim_player import SimPlayer, list_recordings
 
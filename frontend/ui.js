@@ -10,6 +10,7 @@ const ArcaneUI = (() => {
     let _historyLoaded = false;
     let _chatsLoaded = false;
     let _recordingsLoaded = false;
+    let _eventLogKey = '';   // newest event last rendered, to skip no-op polls
 
     function init() {
         _setupTabs();
@@ -57,21 +58,25 @@ const ArcaneUI = (() => {
         const container = document.getElementById('event-log');
         if (!eventsData || !eventsData.events || eventsData.events.length === 0) return;
 
-        let html = '';
-        const events = eventsData.events.slice().reverse();
-
-        for (const evt of events) {
-            const cssClass = 'evt-' + evt.type;
-            const ts = evt.timestamp || '';
-            const content = _escapeHtml(evt.content || '');
+        // Polls usually return the same window; skip re-rendering and the
+        // chats refresh unless a new event has arrived
+        const newest = eventsData.events[eventsData.events.length - 1];
+        const key = `${eventsData.events.length}|${newest.step}|${newest.type}|${newest.timestamp}|${newest.content}`;
+        if (key === _eventLogKey) return;
+        _eventLogKey = key;
 
-            html += `<div class="event-entry ${cssClass}">` +
-                `<span class="timestamp">${ts}</span>` +
-                `${content}` +
+        // Newest first: walk the array backwards instead of copying and reversing it
+        const events = eventsData.events;
+        const rows = new Array(events.length);
+        for (let i = events.length - 1, j = 0; i >= 0; i--, j++) {
+            const evt = events[i];
+            rows[j] = `<div class="event-entry evt-${evt.type}">` +
+                `<span class="timestamp">${evt.timestamp || ''}</span>` +
+                `${_escapeHtml(evt.content || '')}` +
                 `</div>`;
         }
 
-        container.innerHTML = html;
+        container.innerHTML = rows.join('');
 
         // Refresh chats list on new events if tab is open
         if (_chatsLoaded) {
@@ -119,13 +124,19 @@ const ArcaneUI = (() => {
     function updateMetrics(eventsData) {
         if (!eventsData || !eventsData.events) return;
 
-        const events = eventsData.events;
         let msgCount = 0, revealCount = 0, tacticCount = 0;
 
-        for (const evt of events) {
-            if (evt.type === 'message_sent') msgCount++;
-            if (evt.type === 'information_revealed') revealCount++;
-            if (evt.type === 'tactic_used') tacticCount++;
+        if (eventsData.totals) {
+            // Live server: run-wide counts maintained by the event logger
+            msgCount = eventsData.totals.message_sent;
+            revealCount = eventsData.totals.information_revealed;
+            tacticCount = eventsData.totals.tactic_used;
+        } else {
+            for (const evt of eventsData.events) {
+                if (evt.type === 'message_sent') msgCount++;
+                if (evt.type === 'information_revealed') revealCount++;
+                if (evt.type === 'tactic_used') tacticCount++;
+            }
         }
 
         const setVal = (id, val) => {
@@ -428,10 +439,11 @@ const ArcaneUI = (() => {
     }
 
     // --- Helpers ---
+    // String-based escaping: no throwaway DOM node per call
+    const _HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
     function _escapeHtml(text) {
-        const div = document.createElement('div');
-        div.textContent = text;
-        return div.innerHTML;
+        return String(text ?? '').replace(/[&<>"']/g, ch => _HTML_ESCAPES[ch]);
     }
 
     function hideLoading() {
@@ -14,8 +14,9 @@ Commands:
 
 import os
 import sys
+import copy
+import asyncio
 import time
-import yaml
 import signal
 import logging
 import argparse
@@ -23,6 +24,8 @@ import threading
 from pathlib import Path
 from dotenv import load_dotenv
 
+from backend.config.yaml_loader import load_yaml_cached
+
 # Load environment variables
 _project_root = Path(__file__).resolve().parent
 load_dotenv(_project_root / ".env")
@@ -43,13 +46,30 @@ logging.getLogger("root.llm").setLevel(logging.WARNING)
 
 logger = logging.getLogger("root.runner")
 
+# Dashboard server settings. http "auto" picks httptools (installed with
+# uvicorn[standard]) and falls back to h11 otherwise; the event loop is
+# chosen in _serve_in_thread. The dashboard polls several endpoints a second,
+# so per-request access logging is off.
+_UVICORN_OPTIONS = dict(
+    log_level="warning",
+    http="auto",
+    access_log=False,
+    lifespan="off",
+)
+
+# Dashboard worker threads for sync handlers when the GIL is disabled
+FREE_THREADED_WORKERS = 128
+
+# cmd_run writes buffered step summaries once this many lines or seconds pile up
+STATUS_FLUSH_ROWS = 32
+STATUS_FLUSH_SECONDS = 0.5
+
 
 def load_config() -> dict:
     """Load settings.yaml."""
     config_path = _project_root / "backend" / "config" / "settings.yaml"
     if config_path.exists():
-        with open(config_path, encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_cached(config_path)
     return {}
 
 
@@ -62,12 +82,50 @@ def load_scenario(path: str | None) -> dict:
         # Try relative to scenarios dir
         scenario_path = _project_root / "backend" / "scenarios" / path
     if scenario_path.exists():
-        with open(scenario_path, encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+        # Copied: agent creation writes into the scenario's agent dicts
+        return copy.deepcopy(load_yaml_cached(scenario_path))
     logger.warning(f"Scenario file not found: {path}")
     return {}
 
 
+def _gil_disabled() -> bool:
+    """True on a free-threaded (3.13t+) interpreter running with PYTHON_GIL=0."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _serve_in_thread(server) -> threading.Thread:
+    """Run a uvicorn server on its own event loop in a daemon thread.
+
+    Awaits server.serve() directly rather than server.run(), so no signal
+    handlers are set up next to the REPL. Uses uvloop when it is installed.
+    """
+    async def _serve():
+        if _gil_disabled():
+            # Sync handlers run in anyio's worker threads (40 by default); on
+            # a free-threaded build they run in parallel, so allow more
+            import anyio.to_thread
+            anyio.to_thread.current_default_thread_limiter().total_tokens = \
+                FREE_THREADED_WORKERS
+        await server.serve()
+
+    def _run():
+        try:
+            import uvloop
+            loop = uvloop.new_event_loop()
+        except ImportError:  # optional; unavailable on Windows
+            loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(_serve())
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=_run, name="dashboard-server", daemon=True)
+    thread.start()
+    return thread
+
+
 def start_server(model, port: int):
     """Start the FastAPI server in a background thread."""
     import uvicorn
@@ -76,19 +134,30 @@ def start_server(model, port: int):
     set_model(model)
     app = create_app()
 
-    config = uvicorn.Config(
-        app,
-        host="0.0.0.0",
-        port=port,
-        log_level="warning",
-    )
+    config = uvicorn.Config(app, host="0.0.0.0", port=port, **_UVICORN_OPTIONS)
     server = uvicorn.Server(config)
 
-    thread = threading.Thread(target=server.run, daemon=True)
-    thread.start()
+    _serve_in_thread(server)
     return server
 
 
+def _make_prompt():
+    """Return the REPL's line reader: prompt_toolkit if installed, else input().
+
+    Both give line editing and history (input() via readline where the
+    platform has it) and raise EOFError / KeyboardInterrupt the same way.
+    """
+    try:
+        from prompt_toolkit import PromptSession
+    except ImportError:
+        try:
+            import readline  # noqa: F401 — enables editing/history for input()
+        except ImportError:  # Windows
+            pass
+        return input
+    return PromptSession().prompt
+
+
 def print_banner():
     """Print the ARCANE startup banner."""
     print()
@@ -119,32 +188,43 @@ def print_help():
 
 def cmd_run(model, args):
     """Execute N simulation steps."""
-    try:
-        n = int(args[0]) if args else 1
-    except ValueError:
+    if args and not args[0].isdecimal():
         print("  Usage: run <number>")
         return
+    n = int(args[0]) if args else 1
 
     from backend.research.event_logger import EventType
 
     print(f"  Running {n} step(s)...")
-    start_time = time.time()
+    event_logger = model.event_logger
+    clock = time.perf_counter
+    start_time = last_flush = clock()
+
+    # Step summaries are buffered and written together at most every
+    # STATUS_FLUSH_SECONDS (or STATUS_FLUSH_ROWS lines), so fast steps don't
+    # pay for a print each while slow LLM-bound steps still report live
+    rows: list[str] = []
 
+    done = 0
     for i in range(n):
-        step_start = time.time()
+        step_start = clock()
+        prev_step = model.step_count
         model.step()
-        step_time = time.time() - step_start
+        step_end = clock()
+        if model.step_count == prev_step:
+            # step() is a no-op once the model is closed (e.g. replaced by a
+            # relaunch from the dashboard)
+            rows.append("  Simulation was closed; stopping.\n")
+            break
+        done += 1
 
         # Count events for this step
-        step_events = model.event_logger.get_recent_events(50)
-        msg_count = sum(1 for e in step_events
-                        if e.event_type == EventType.MESSAGE_SENT
-                        and e.step == model.step_count)
-        reveal_count = sum(1 for e in step_events
-                          if e.event_type == EventType.INFORMATION_REVEALED
-                          and e.step == model.step_count)
-
-        # Print step summary
+        msg_count = event_logger.count_for_step(
+            model.step_count, EventType.MESSAGE_SENT)
+        reveal_count = event_logger.count_for_step(
+            model.step_count, EventType.INFORMATION_REVEALED)
+
+        # Step summary
         status_parts = [
             f"Step {i+1}/{n}",
             f"[{model.sim_time_str}]",
@@ -155,22 +235,30 @@ def cmd_run(model, args):
         if reveal_count:
             status_parts.append(f"⚠ {reveal_count} reveals!")
 
-        status_parts.append(f"({step_time:.1f}s)")
-        print(f"  {'  '.join(status_parts)}")
+        status_parts.append(f"({step_end - step_start:.1f}s)")
+        rows.append(f"  {'  '.join(status_parts)}\n")
 
-    total_time = time.time() - start_time
-    print(f"  Done. {n} steps in {total_time:.1f}s")
-    print()
+        if (len(rows) >= STATUS_FLUSH_ROWS
+                or step_end - last_flush >= STATUS_FLUSH_SECONDS):
+            sys.stdout.write("".join(rows))
+            sys.stdout.flush()
+            rows.clear()
+            last_flush = step_end
+
+    total_time = clock() - start_time
+    rows.append(f"  Done. {done} steps in {total_time:.1f}s\n\n")
+    sys.stdout.write("".join(rows))
+    sys.stdout.flush()
 
 
 def cmd_status(model):
     """Show current simulation state."""
     from backend.research.event_logger import EventType
 
-    all_events = model.event_logger.get_recent_events(500)
-    msg_count = sum(1 for e in all_events if e.event_type == EventType.MESSAGE_SENT)
-    reveal_count = sum(1 for e in all_events if e.event_type == EventType.INFORMATION_REVEALED)
-    tactic_count = sum(1 for e in all_events if e.event_type == EventType.TACTIC_USED)
+    count = model.event_logger.count_by_type
+    msg_count = count(EventType.MESSAGE_SENT)
+    reveal_count = count(EventType.INFORMATION_REVEALED)
+    tactic_count = count(EventType.TACTIC_USED)
 
     print(f"  Step: {model.step_count} | Time: {model.sim_time_str}")
     print(f"  Messages: {msg_count} | Info reveals: {reveal_count} | Tactics: {tactic_count}")
@@ -180,27 +268,27 @@ def cmd_status(model):
 
 def cmd_agents(model):
     """List all agents with details."""
-    for agent_id, agent in model.agents_by_id.items():
-        agent_type = getattr(agent, 'agent_type', 'benign')
-        name = getattr(agent, 'name', 'Unknown')
-        location = getattr(agent, 'current_location_name', '?')
-        activity = getattr(agent, 'current_activity', 'idle')
-
+    # BaseAgent sets all of these in __init__, so no getattr defaults needed
+    rows = []
+    for agent in model.agents_by_id.values():
+        agent_type = agent.agent_type
         emoji = "🕵️" if agent_type == "deviant" else "👤"
         type_label = f"[{agent_type}]"
 
-        print(f"  {emoji} {name:<20} {type_label:<10} @ {location:<20} \"{activity[:40]}\"")
-    print()
+        rows.append(f"  {emoji} {agent.name:<20} {type_label:<10} "
+                    f"@ {agent.current_location_name:<20} "
+                    f"\"{agent.current_activity[:40]}\"\n")
+
+    # One write for the whole table instead of a print per agent
+    rows.append("\n")
+    sys.stdout.write("".join(rows))
 
 
 def cmd_log(model, args):
     """Show recent events."""
-    try:
-        n = int(args[0]) if args else 20
-    except ValueError:
-        n = 20
+    n = int(args[0]) if args and args[0].isdecimal() else 20
 
-    events = model.event_logger.get_recent_events(n)
+    events = model.event_logger.get_recent_events(max(n, 1))
 
     if not events:
         print("  No events yet.")
@@ -360,16 +448,11 @@ def main():
 
         app = create_app()
 
-        uv_config = uvicorn.Config(
-            app,
-            host="0.0.0.0",
-            port=args.port,
-            log_level="warning",
-        )
+        uv_config = uvicorn.Config(app, host="0.0.0.0", port=args.port,
+                                   **_UVICORN_OPTIONS)
         server = uvicorn.Server(uv_config)
 
-        thread = threading.Thread(target=server.run, daemon=True)
-        thread.start()
+        _serve_in_thread(server)
 
         print(f"  Frontend: http://localhost:{args.port}")
         print()
@@ -391,11 +474,8 @@ def main():
 
         model = _srv._model
         print(f"\n  Simulation launched!")
-        deviant_count = sum(1 for a in model.agents_by_id.values()
-                            if getattr(a, 'agent_type', '') == 'deviant')
-        benign_count = len(model.agents_by_id) - deviant_count
         print(f"  Model loaded: {len(model.agents_by_id)} agents "
-              f"({deviant_count} deviant, {benign_count} benign)")
+              f"({model.deviant_count} deviant, {model.benign_count} benign)")
 
         # Print LLM config
         llm_cfg = model.config.get("llm", {})
@@ -413,11 +493,8 @@ def main():
         from backend.model import ArcaneModel
         model = ArcaneModel(scenario=scenario, config=config)
 
-        deviant_count = sum(1 for a in model.agents_by_id.values()
-                            if getattr(a, 'agent_type', '') == 'deviant')
-        benign_count = len(model.agents_by_id) - deviant_count
         print(f"  Model loaded: {len(model.agents_by_id)} agents "
-              f"({deviant_count} deviant, {benign_count} benign)")
+              f"({model.deviant_count} deviant, {model.benign_count} benign)")
 
         # Print LLM config
         llm_cfg = config.get("llm", {})
@@ -439,14 +516,16 @@ def main():
     # Headless mode: run and exit
     if args.headless:
         cmd_run(model, [str(args.steps)])
+        model.close()
         return
 
     # Interactive REPL
     print_help()
+    prompt = _make_prompt()
 
     while True:
         try:
-            raw = input("arcane> ").strip()
+            raw = prompt("arcane> ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\n  Goodbye!")
             break
@@ -454,6 +533,10 @@ def main():
         if not raw:
             continue
 
+        # A relaunch from the setup screen replaces (and closes) the model
+        if use_setup:
+            model = _srv._model
+
         parts = raw.split()
         cmd = parts[0].lower()
         cmd_args = parts[1:]
@@ -502,6 +585,8 @@ def main():
         else:
             print(f"  Unknown command: {cmd}. Type 'help' for available commands.")
 
+    model.close()
+
 
 if __name__ == "__main__":
     main()
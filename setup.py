@@ -12,7 +12,7 @@ setup(
         "python-dotenv>=1.0.0",
         "networkx>=3.0",
         "fastapi>=0.109.0",
-        "uvicorn>=0.27.0",
+        "uvicorn[standard]>=0.27.0",
     ],
     python_requires=">=3.10",
 )
@@ -0,0 +1,58 @@
+"""Compressed run logs must stay readable while the run is still open."""
+
+from pathlib import Path
+
+import pytest
+
+from backend.research import event_logger as el
+from backend.research.event_logger import EventLogger, EventType, SimEvent
+from backend.research.results_analyzer import _scan_run_counts, analyze_file
+
+CODECS = [
+    "gzip",
+    pytest.param("zstd", marks=pytest.mark.skipif(
+        el._log_codec("zstd") != "zstd", reason="zstandard not installed")),
+]
+
+
+def _log_steps(logger: EventLogger, steps: int) -> None:
+    for step in range(1, steps + 1):
+        logger.log_step_start(step, "Monday 09:00 AM")
+        logger.log_info_revealed(step, "Monday 09:00 AM", "agent_benign_1",
+                                 "agent_deviant_1", "sms", "email", "low")
+        logger.log_step_end(step, "Monday 09:00 AM")
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_open_compressed_log_is_readable(tmp_path, monkeypatch, codec):
+    monkeypatch.setattr(el, "LOG_COMPRESS", codec)
+    logger = EventLogger(log_dir=str(tmp_path))
+    try:
+        _log_steps(logger, 3)
+        logger.flush()
+
+        # Run still open: no sidecar yet, so both readers scan the log itself
+        assert _scan_run_counts(Path(logger.log_file_path)) == (3, 3)
+        results = analyze_file(logger.log_file_path)
+        assert results.total_steps == 3
+        assert results.total_reveals == 3
+    finally:
+        logger.close()
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_truncated_trailing_frame_is_ignored(tmp_path, monkeypatch, codec):
+    monkeypatch.setattr(el, "LOG_COMPRESS", codec)
+    logger = EventLogger(log_dir=str(tmp_path))
+    _log_steps(logger, 2)
+    logger.close()
+
+    # Simulate a crash mid-write: half of one more compressed batch
+    partial = el._batch_compressor(codec)(
+        SimEvent(step=3, event_type=EventType.STEP_START,
+                 timestamp="Monday 09:00 AM").as_json().encode() + b"\n")
+    with open(logger.log_file_path, "ab") as f:
+        f.write(partial[: len(partial) // 2])
+
+    assert _scan_run_counts(Path(logger.log_file_path)) == (2, 2)
+    assert analyze_file(logger.log_file_path).total_steps == 2
@@ -0,0 +1,91 @@
+"""Background JSONL writer: batching, failure handling, flush/close."""
+
+import json
+
+import pytest
+
+from backend.research.event_logger import EventLogger, EventType, SimEvent
+from backend.research.results_analyzer import list_runs
+
+
+@pytest.fixture
+def logger(tmp_path):
+    event_logger = EventLogger(log_dir=str(tmp_path))
+    yield event_logger
+    event_logger.close()
+
+
+def _lines(event_logger: EventLogger) -> list[dict]:
+    with open(event_logger.log_file_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_flush_writes_everything_logged(logger):
+    for step in range(1, 101):
+        logger.log_step_start(step, "Monday 09:00 AM")
+    logger.flush()
+
+    assert [e["step"] for e in _lines(logger)] == list(range(1, 101))
+
+
+def test_unserializable_event_is_skipped_not_fatal(logger):
+    logger.log(SimEvent(step=1, event_type=EventType.AGENT_PLAN,
+                        timestamp="Monday 09:00 AM", metadata={"bad": {1, 2}}))
+    logger.log_step_start(2, "Monday 09:10 AM")
+    logger.flush()
+    logger.log_step_start(3, "Monday 09:20 AM")
+    logger.flush()
+
+    assert [e["step"] for e in _lines(logger)] == [2, 3]
+    assert logger._writer.is_alive()
+
+
+def test_write_error_keeps_writer_draining(logger, monkeypatch):
+    write_all = logger._write_all
+    calls = []
+
+    def failing_once(buf):
+        calls.append(buf)
+        if len(calls) == 1:
+            raise OSError(28, "No space left on device")
+        write_all(buf)
+
+    monkeypatch.setattr(logger, "_write_all", failing_once)
+    logger.log_step_start(1, "Monday 09:00 AM")
+    logger.flush()  # must return even though the batch was lost
+    logger.log_step_start(2, "Monday 09:10 AM")
+    logger.flush()
+
+    assert [e["step"] for e in _lines(logger)] == [2]
+
+
+def test_flush_returns_if_writer_is_gone(logger):
+    logger._queue.put(None)  # stop the writer behind the logger's back
+    logger._writer.join()
+    logger.log_step_start(1, "Monday 09:00 AM")
+    logger.flush()
+
+
+def test_log_after_close_raises(tmp_path):
+    event_logger = EventLogger(log_dir=str(tmp_path))
+    event_logger.close()
+    event_logger.close()  # idempotent
+    with pytest.raises(RuntimeError):
+        event_logger.log_step_start(1, "Monday 09:00 AM")
+
+
+def test_close_writes_sidecar_used_by_list_runs(tmp_path):
+    event_logger = EventLogger(log_dir=str(tmp_path))
+    for step in (1, 2):
+        event_logger.log_step_start(step, "Monday 09:00 AM")
+        event_logger.log_info_revealed(step, "Monday 09:00 AM", "a", "b",
+                                       "sms", "email", "low")
+    event_logger.close()
+
+    meta_path = tmp_path / f"run_{event_logger.run_id}.meta.json"
+    assert json.loads(meta_path.read_text())["steps"] == 2
+
+    # Counts come from the sidecar, not a rescan of the log
+    meta_path.write_text(json.dumps({"steps": 7, "reveals": 5}))
+    [run] = list_runs(str(tmp_path))
+    assert (run["steps"], run["reveals"]) == (7, 5)
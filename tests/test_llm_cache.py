@@ -0,0 +1,93 @@
+"""Completion cache: deterministic-only reuse and single-flight coalescing."""
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.llms import _cache
+
+
+class FakeProvider:
+    model_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    @_cache.async_memoize
+    async def complete(self, system_prompt, messages,
+                       temperature=0.7, max_tokens=1024):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return f"reply {self.calls}"
+
+    @_cache.memoize
+    def complete_sync(self, system_prompt, messages,
+                      temperature=0.7, max_tokens=1024):
+        self.calls += 1
+        threading.Event().wait(0.05)
+        return f"reply {self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(_cache, "LLM_CACHE_SAMPLED", False)
+    _cache.clear_cache()
+    yield
+    _cache.clear_cache()
+
+
+def test_async_concurrent_identical_requests_share_one_call():
+    provider = FakeProvider()
+
+    async def burst():
+        return await asyncio.gather(*(
+            provider.complete("sys", [{"role": "user", "content": "hi"}], 0)
+            for _ in range(10)))
+
+    assert set(asyncio.run(burst())) == {"reply 1"}
+    assert provider.calls == 1
+
+    # Later identical request is a cache hit; clear_cache forgets it
+    assert asyncio.run(provider.complete("sys", [{"role": "user", "content": "hi"}], 0)) == "reply 1"
+    _cache.clear_cache()
+    asyncio.run(provider.complete("sys", [{"role": "user", "content": "hi"}], 0))
+    assert provider.calls == 2
+
+
+def test_sampled_requests_are_never_reused():
+    provider = FakeProvider()
+    messages = [{"role": "user", "content": "hi"}]
+    first = asyncio.run(provider.complete("sys", messages, 0.7))
+    second = asyncio.run(provider.complete("sys", messages, 0.7))
+    assert first != second
+    assert provider.calls == 2
+
+
+def test_sync_threads_single_flight():
+    provider = FakeProvider()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        provider.complete_sync("sys", [{"role": "user", "content": "x"}], 0)))
+        for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["reply 1"] * 8
+    assert provider.calls == 1
+
+
+def test_error_replies_are_not_cached():
+    class Failing(FakeProvider):
+        @_cache.async_memoize
+        async def complete(self, system_prompt, messages,
+                           temperature=0.7, max_tokens=1024):
+            self.calls += 1
+            return "[LLM Error: boom]"
+
+    provider = Failing()
+    asyncio.run(provider.complete("sys", [], 0))
+    asyncio.run(provider.complete("sys", [], 0))
+    assert provider.calls == 2
@@ -0,0 +1,68 @@
+"""ArcaneModel.close() against a step running on another thread."""
+
+import socket
+import threading
+
+import pytest
+
+pytest.importorskip("mesa")
+
+from backend.model import ArcaneModel
+
+
+@pytest.fixture
+def silent_llm_server():
+    """Accepts connections and never answers, so LLM calls hang until timeout."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(64)
+    yield f"http://127.0.0.1:{server.getsockname()[1]}/v1"
+    server.close()
+
+
+def _model(base_url: str, tmp_path, monkeypatch) -> ArcaneModel:
+    monkeypatch.chdir(tmp_path)  # run logs go under ./storage
+    role = {"provider": "local", "model": "test"}
+    return ArcaneModel(config={
+        "llm": {"benign_agents": role, "deviant_agents": role, "reflection": role},
+        "local_llm": {"base_url": base_url, "timeout": 0.5},
+    })
+
+
+def test_close_waits_for_running_step(silent_llm_server, tmp_path, monkeypatch):
+    model = _model(silent_llm_server, tmp_path, monkeypatch)
+    started = threading.Event()
+    errors = []
+
+    def run():
+        started.set()
+        try:
+            for _ in range(3):
+                model.step()
+        except BaseException as e:
+            errors.append(e)
+
+    stepper = threading.Thread(target=run)
+    stepper.start()
+    started.wait()
+    model.close()
+    stepper.join(timeout=60)
+
+    assert not stepper.is_alive()
+    assert errors == []
+    assert model.closed
+
+    # Further steps are no-ops
+    step_count = model.step_count
+    model.step()
+    assert model.step_count == step_count
+
+
+def test_local_provider_does_not_start_loop_thread(silent_llm_server, tmp_path,
+                                                   monkeypatch):
+    model = _model(silent_llm_server, tmp_path, monkeypatch)
+    for agent in model.agents_by_id.values():
+        agent.llm
+    assert model._loop is None
+    model.close()
+    model.close()  # idempotent
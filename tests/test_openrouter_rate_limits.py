@@ -0,0 +1,41 @@
+"""Retry-After / X-RateLimit-Reset parsing and backoff for OpenRouter."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from backend.llms import openrouter_provider as orp
+
+
+def test_retry_after_seconds():
+    assert orp._retry_after_seconds({"retry-after": "12"}) == 12.0
+    assert orp._retry_after_seconds({"retry-after": "-3"}) == 0.0
+
+
+def test_retry_after_http_date():
+    headers = {"retry-after": formatdate(time.time() + 30, usegmt=True)}
+    assert 28 <= orp._retry_after_seconds(headers) <= 30
+
+
+def test_ratelimit_reset_epoch_ms_and_seconds():
+    reset_ms = str(int((time.time() + 20) * 1000))
+    assert 18 <= orp._retry_after_seconds({"x-ratelimit-reset": reset_ms}) <= 20
+    reset_s = str(int(time.time() + 20))
+    assert 18 <= orp._retry_after_seconds({"x-ratelimit-reset": reset_s}) <= 20
+
+
+def test_unparseable_or_missing_headers():
+    assert orp._retry_after_seconds({}) is None
+    assert orp._retry_after_seconds({"x-ratelimit-reset": "soon"}) is None
+    # A garbled Retry-After falls through to the reset header
+    reset_s = str(int(time.time() + 10))
+    assert orp._retry_after_seconds(
+        {"retry-after": "later", "x-ratelimit-reset": reset_s}) > 0
+
+
+def test_backoff_delay_respects_cap():
+    for attempt in range(10):
+        assert 0 < orp._backoff_delay(attempt) <= orp.MAX_RATE_LIMIT_WAIT